@@ -0,0 +1 @@
+"""benchmark suite of the extraction, conversion and reading stages"""
@@ -0,0 +1,281 @@
+"""runs the benchmark suite:
+
+python -m benchmarks --size 20 --save baseline.json
+python -m benchmarks --size 20 --compare baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from lxml import etree
+
+from documentstore_migracao.export import article
+from documentstore_migracao.processing import conversion, reading
+from documentstore_migracao.utils import xml
+from documentstore_migracao.utils.convert_html_body import Convert2SPSBody
+
+from benchmarks import corpus
+from benchmarks.articlemeta import ArticleMetaServer, ISSN
+from tests.utils import environ
+
+
+def peak_rss_kb():
+    if resource is None:  # pragma: no cover
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    index = max(0, int(round(pct / 100.0 * len(values))) - 1)
+    return values[index]
+
+
+def milliseconds(seconds):
+    return seconds * 1000 if seconds is not None else None
+
+
+def summarize(latencies, elapsed, errors=0, rss_before=None):
+    """ ru_maxrss only grows, so the memory of a stage is how much the peak rose
+    since the stage started """
+
+    rss_after = peak_rss_kb()
+    return {
+        "docs": len(latencies),
+        "errors": errors,
+        "docs_per_sec": len(latencies) / elapsed if elapsed else None,
+        "p50_ms": milliseconds(percentile(latencies, 50)),
+        "p90_ms": milliseconds(percentile(latencies, 90)),
+        "p99_ms": milliseconds(percentile(latencies, 99)),
+        "max_ms": milliseconds(max(latencies, default=None)),
+        "peak_rss_kb": rss_after,
+        "rss_growth_kb": rss_after - rss_before
+        if None not in (rss_before, rss_after)
+        else None,
+    }
+
+
+def bench(func, items):
+    """ latency of func for each item, the items that fail are counted """
+
+    latencies = []
+    errors = 0
+    rss_before = peak_rss_kb()
+    start = time.perf_counter()
+    for item in items:
+        begin = time.perf_counter()
+        try:
+            func(item)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - begin)
+    return summarize(latencies, time.perf_counter() - start, errors, rss_before)
+
+
+def bench_iter(iterator):
+    """interval between the items yielded by the iterator"""
+
+    latencies = []
+    rss_before = peak_rss_kb()
+    start = last = time.perf_counter()
+    for _ in iterator:
+        now = time.perf_counter()
+        latencies.append(now - last)
+        last = now
+    return summarize(latencies, time.perf_counter() - start, rss_before=rss_before)
+
+
+def run_profile(profile, size, latency, workdir):
+
+    results = {}
+    source_path = os.path.join(workdir, profile, "source")
+    conversion_path = os.path.join(workdir, profile, "conversion")
+    os.makedirs(source_path)
+    os.makedirs(conversion_path)
+
+    with ArticleMetaServer(profile, size, latency) as server:
+        with environ(AM_URL_API=server.url):
+            codes = list(server.httpd.codes)
+            results["extraction"] = bench(article.ext_article_with_version, codes)
+            results["harvest"] = bench_iter(article.iter_articles(ISSN))
+
+    source_files = corpus.generate(source_path, profile, size)
+    bodies = [etree.parse(path).find("body/p").text for path in source_files]
+    results["convert_body"] = bench(
+        lambda body: Convert2SPSBody(body).process(), bodies
+    )
+
+    with environ(SOURCE_PATH=source_path, CONVERSION_PATH=conversion_path):
+        results["conversion"] = bench(conversion.conversion_article_xml, source_files)
+
+        converted_files = [
+            os.path.join(conversion_path, name)
+            for name in sorted(os.listdir(conversion_path))
+        ]
+        trees = [etree.parse(path).getroot() for path in converted_files]
+        results["find_medias"] = bench(xml.find_medias, trees)
+        results["reading"] = bench(
+            lambda path: reading.reading_article_xml(path, move_success=False),
+            converted_files,
+        )
+
+    return results
+
+
+def run_isolated(func, *args):
+    """ runs func in a fresh process, so the RSS peak of a profile does not
+    inherit the memory of the previous ones """
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func, *args).result()
+
+
+def compare(results, baseline, tolerance):
+    """list of the stages whose throughput fell below the baseline"""
+
+    regressions = []
+    for profile, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get(profile, {}).get(stage)
+            if not previous or not previous.get("docs_per_sec"):
+                continue
+            if current["docs_per_sec"] is None:
+                continue
+
+            ratio = current["docs_per_sec"] / previous["docs_per_sec"]
+            print(
+                "%-8s %-13s %10.1f docs/s  baseline %10.1f  (%+.1f%%)"
+                % (
+                    profile,
+                    stage,
+                    current["docs_per_sec"],
+                    previous["docs_per_sec"],
+                    (ratio - 1) * 100,
+                )
+            )
+            if ratio < 1 - tolerance:
+                regressions.append((profile, stage, ratio))
+    return regressions
+
+
+def number(value, precision):
+    return "-" if value is None else "%.*f" % (precision, value)
+
+
+def report(results):
+
+    print(
+        "%-8s %-13s %6s %6s %10s %9s %9s %9s %9s %11s %9s"
+        % (
+            "profile",
+            "stage",
+            "docs",
+            "errors",
+            "docs/s",
+            "p50 ms",
+            "p90 ms",
+            "p99 ms",
+            "max ms",
+            "peak RSS kB",
+            "+RSS kB",
+        )
+    )
+    for profile, stages in results.items():
+        for stage, data in stages.items():
+            print(
+                "%-8s %-13s %6s %6s %10s %9s %9s %9s %9s %11s %9s"
+                % (
+                    profile,
+                    stage,
+                    data["docs"],
+                    data["errors"],
+                    number(data["docs_per_sec"], 1),
+                    number(data["p50_ms"], 2),
+                    number(data["p90_ms"], 2),
+                    number(data["p99_ms"], 2),
+                    number(data["max_ms"], 2),
+                    number(data["peak_rss_kb"], 0),
+                    number(data.get("rss_growth_kb"), 0),
+                )
+            )
+
+
+def main(args=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark da migração")
+    parser.add_argument("--size", type=int, default=20, help="Artigos por perfil")
+    parser.add_argument(
+        "--profiles",
+        default=",".join(sorted(corpus.PROFILES)),
+        help="Perfis do corpus separados por virgula",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Latência do ArticleMeta em ms"
+    )
+    parser.add_argument("--save", help="Grava o resultado como baseline")
+    parser.add_argument("--compare", help="Compara o resultado com o baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="Queda de vazão tolerada"
+    )
+    args = parser.parse_args(args)
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for profile in args.profiles.split(","):
+            results[profile] = run_isolated(
+                run_profile, profile, args.size, args.latency / 1000.0, workdir
+            )
+
+    report(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "python": platform.python_version(),
+                        "lxml": ".".join(str(v) for v in etree.LXML_VERSION),
+                        "size": args.size,
+                        "latency_ms": args.latency,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = compare(results, baseline, args.tolerance)
+        for profile, stage, ratio in regressions:
+            print(
+                "REGRESSAO: %s/%s %.1f%% mais lento"
+                % (profile, stage, (1 - ratio) * 100)
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
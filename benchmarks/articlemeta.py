@@ -0,0 +1,99 @@
+"""module to a local stand-in of the ArticleMeta API"""
+
+import json
+import time
+import threading
+import socketserver
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from benchmarks import corpus
+
+ISSN = "0000-0000"
+PROCESSING_DATE = "2019-01-01"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type):
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        server = self.server
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if url.path.endswith("/journal/identifiers/"):
+            return self._send(
+                json.dumps({"meta": {"total": 1}, "objects": [{"code": ISSN}]}),
+                "application/json",
+            )
+
+        if url.path.endswith("/article/identifiers/"):
+            offset = int(params.get("offset", 0))
+            limit = int(params.get("limit", 1000))
+            codes = server.codes[offset : offset + limit]
+            return self._send(
+                json.dumps(
+                    {
+                        "meta": {"total": len(server.codes), "offset": offset},
+                        "objects": [
+                            {"code": code, "processing_date": PROCESSING_DATE}
+                            for code in codes
+                        ],
+                    }
+                ),
+                "application/json",
+            )
+
+        if url.path.endswith("/article"):
+            profile, index = server.articles[params["code"]]
+            if params.get("format") == "xmlrsps":
+                return self._send(corpus.article_xml(profile, index), "application/xml")
+            return self._send(
+                json.dumps({"code": params["code"], "version": "html"}),
+                "application/json",
+            )
+
+        self.send_error(404)
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ArticleMetaServer:
+    """ArticleMeta API serving the synthetic corpus of a profile in a
+    background thread, with an optional latency per request (seconds)"""
+
+    def __init__(self, profile, size, latency=0):
+        self.httpd = _Server(("127.0.0.1", 0), _Handler)
+        self.httpd.latency = latency
+        self.httpd.articles = {
+            corpus.article_code(profile, index): (profile, index)
+            for index in range(size)
+        }
+        self.httpd.codes = sorted(self.httpd.articles)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return "http://%s:%s/api/v1" % self.httpd.server_address
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,112 @@
+"""module to generate a synthetic corpus of legacy HTML-body articles"""
+
+import os
+import random
+from xml.sax.saxutils import escape
+
+ARTICLE_TEMPLATE = """<article xmlns:xlink="http://www.w3.org/1999/xlink" \
+specific-use="sps-1.4" dtd-version="1.0" article-type="research-article">\
+<front><article-meta><article-id pub-id-type="publisher-id">%(code)s</article-id>\
+</article-meta></front><body specific-use="quirks-mode"><p>%(body)s</p></body>\
+</article>"""
+
+WORDS = (
+    "salud publica control metabolico paciente diabetico retrasa inicio "
+    "complicaciones cronicas tratamiento intensivo mantiene niveles glucemia"
+).split()
+
+
+def _text(rnd, size):
+    return " ".join(rnd.choice(WORDS) for _ in range(size))
+
+
+def _paragraph(rnd):
+    return '<p align="left">%s <i>%s</i> %s <b>%s</b></p>' % (
+        _text(rnd, 30),
+        _text(rnd, 3),
+        _text(rnd, 20),
+        _text(rnd, 2),
+    )
+
+
+def body_small(rnd):
+    return "".join(_paragraph(rnd) for _ in range(5))
+
+
+def body_huge(rnd):
+    parts = []
+    for i in range(2000):
+        parts.append(_paragraph(rnd))
+        if i % 100 == 0:
+            parts.append(
+                "<ul>%s</ul><ol>%s</ol>"
+                % (
+                    "".join("<li>%s</li>" % _text(rnd, 5) for _ in range(10)),
+                    "".join("<li>%s</li>" % _text(rnd, 5) for _ in range(10)),
+                )
+            )
+    return "".join(parts)
+
+
+def body_nested(rnd):
+    depth = 50
+    opening = "".join(
+        '<div id="d%s"><ul><li>%s' % (level, _text(rnd, 3)) for level in range(depth)
+    )
+    closing = "</li></ul></div>" * depth
+    return opening + _paragraph(rnd) + closing
+
+
+def body_links(rnd):
+    parts = []
+    total = 300
+    for i in range(total):
+        parts.append(
+            '<p>%s<a href="#fn%s"><sup>%s</sup></a> <a href="http://www.scielo.org/%s">'
+            'link</a> <a href="mailto:autor%s@scielo.org">autor%s@scielo.org</a></p>'
+            % (_text(rnd, 10), i, i, i, i, i)
+        )
+        if i % 10 == 0:
+            parts.append(
+                '<p><img src="/img/revistas/spm/v1n1/a%sfig%s.gif"/>'
+                '<a href="/img/revistas/spm/v1n1/a%s.pdf">pdf</a></p>' % (i, i, i)
+            )
+    for i in range(total):
+        parts.append('<p><a name="fn%s" id="fn%s"></a>%s</p>' % (i, i, _text(rnd, 15)))
+    return "".join(parts)
+
+
+PROFILES = {
+    "small": body_small,
+    "huge": body_huge,
+    "nested": body_nested,
+    "links": body_links,
+}
+
+
+def article_code(profile, index):
+
+    return "S0000-%04d%013d" % (sorted(PROFILES).index(profile), index)
+
+
+def article_xml(profile, index, seed=0):
+    """XML of a synthetic article of the profile, as ArticleMeta delivers it
+    in the xmlrsps format, with the HTML body escaped in body/p"""
+
+    rnd = random.Random("%s-%s-%s" % (seed, profile, index))
+    return ARTICLE_TEMPLATE % {
+        "code": article_code(profile, index),
+        "body": escape(PROFILES[profile](rnd)),
+    }
+
+
+def generate(path, profile, size, seed=0):
+    """writes `size` articles of the profile in path and returns their paths"""
+
+    paths = []
+    for index in range(size):
+        file_path = os.path.join(path, "%s.xml" % article_code(profile, index))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(article_xml(profile, index, seed))
+        paths.append(file_path)
+    return paths
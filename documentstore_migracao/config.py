@@ -1,23 +1,152 @@
 import os
+import configparser
+from typing import NamedTuple
 
 BASE_PATH = os.path.dirname(os.path.dirname(__file__))
 
-_default = dict(
-    SCIELO_COLLECTION="spa",
-    AM_URL_API="http://articlemeta.scielo.org/api/v1",
-    SOURCE_PATH=os.path.join(BASE_PATH, "xml/source"),
-    CONVERSION_PATH=os.path.join(BASE_PATH, "xml/conversion"),
-    SUCCESS_PROCESSING_PATH=os.path.join(BASE_PATH, "xml/sucess"),
-    LOGGER_PATH=os.path.join(BASE_PATH, ""),
-)
+# seção do arquivo de configuração informado em --config
+CONFIG_SECTION = "documentstore_migracao"
 
-INITIAL_PATH = [
-    _default["LOGGER_PATH"],
-    _default["SOURCE_PATH"],
-    _default["SUCCESS_PROCESSING_PATH"],
-    _default["CONVERSION_PATH"],
-]
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+class Settings(NamedTuple):
+    """ settings of the run, resolved once from the config file and the
+    environment variables of the same names """
+
+    SCIELO_COLLECTION: str = "spa"
+    AM_URL_API: str = "http://articlemeta.scielo.org/api/v1"
+    SOURCE_PATH: str = os.path.join(BASE_PATH, "xml/source")
+    CONVERSION_PATH: str = os.path.join(BASE_PATH, "xml/conversion")
+    SUCCESS_PROCESSING_PATH: str = os.path.join(BASE_PATH, "xml/sucess")
+    QUARANTINE_PATH: str = os.path.join(BASE_PATH, "xml/quarantine")
+    VALIDATION_REPORT_PATH: str = os.path.join(BASE_PATH, "xml/validation")
+    LOGGER_PATH: str = os.path.join(BASE_PATH, "")
+    LOGGER_BULK: bool = False
+    LOGGER_SAMPLE_RATE: int = 100
+    LOGGER_ERROR_MAX_BYTES: int = 256 * 1024 ** 2
+    LOGGER_ERROR_BACKUP_COUNT: int = 5
+    MANIFEST_PATH: str = os.path.join(BASE_PATH, "manifest.db")
+    MEDIA_MANIFEST_PATH: str = os.path.join(BASE_PATH, "media.jsonl")
+    AM_PAGE_SIZE: int = 1000
+    THREADPOOL_MAX_WORKERS: int = 10
+    PROCESSPOOL_MAX_WORKERS: int = 1
+    PROCESSPOOL_CHUNKSIZE: int = 10
+    PENDING_PER_WORKER: int = 2
+    EXTRACTION_MAX_JOURNALS: int = 4
+    REQUEST_MAX_PER_HOST: int = 10
+    REQUEST_POOL_SIZE: int = 10
+    REQUEST_TIMEOUT: float = 30
+    REQUEST_RETRIES: int = 5
+    REQUEST_BACKOFF_FACTOR: float = 0.5
+    REQUEST_RATE_LIMIT: float = 0
+    ASYNC_MAX_REQUESTS: int = 1000
+    ASYNC_MAX_PER_HOST: int = 100
+    REQUEST_CACHE_PATH: str = ""
+    REQUEST_CACHE_TTL: float = 86400
+    REQUEST_CACHE_MAX_SIZE: int = 1024 ** 3
+    METRICS_PATH: str = ""
+    METRICS_INTERVAL: float = 60
+
+
+_settings = None
+_config_path = None
+
+
+def convert(name, value):
+    """ value of the setting converted to the type of its field """
+
+    field_type = Settings.__annotations__[name]
+    if field_type is bool:
+        return value.strip().lower() in TRUE_VALUES
+    try:
+        return field_type(value)
+    except ValueError:
+        raise ValueError("Valor inválido para %s: %r" % (name, value)) from None
+
+
+def read_config_file(path):
+    """ settings of the documentstore_migracao section of the INI file """
+
+    parser = configparser.ConfigParser()
+    parser.optionxform = str.upper
+    with open(path, encoding="utf-8") as f:
+        parser.read_file(f)
+
+    if not parser.has_section(CONFIG_SECTION):
+        return {}
+
+    values = dict(parser.items(CONFIG_SECTION))
+    unknown = set(values) - set(Settings._fields)
+    if unknown:
+        raise ValueError(
+            "Configurações desconhecidas em %s: %s" % (path, ", ".join(sorted(unknown)))
+        )
+    return values
+
+
+def load(path=None, environ=None):
+    """ settings from the defaults, overridden by the config file, if any,
+    and by the environment variables """
+
+    if environ is None:
+        environ = os.environ
+
+    values = read_config_file(path) if path else {}
+    values.update((name, environ[name]) for name in Settings._fields if name in environ)
+    return Settings(**{name: convert(name, value) for name, value in values.items()})
+
+
+def configure(path=None):
+    """ resolves the settings again, reading the config file of path """
+
+    global _config_path, _settings
+
+    _config_path = path
+    _settings = load(path)
+    return _settings
+
+
+def settings():
+    """ settings resolved on the first call and reused by the next ones """
+
+    global _settings
+
+    if _settings is None:
+        _settings = load(_config_path)
+    return _settings
+
+
+def set_settings(obj_settings):
+    """ uses the settings of another process, as the initializer of a pool """
+
+    global _settings
+
+    _settings = obj_settings
+
+
+def reset():
+    """ discards the settings, so that they are resolved again """
+
+    global _settings
+
+    _settings = None
+
+
+def initial_path():
+
+    obj_settings = settings()
+    return [
+        obj_settings.LOGGER_PATH,
+        obj_settings.SOURCE_PATH,
+        obj_settings.SUCCESS_PROCESSING_PATH,
+        obj_settings.CONVERSION_PATH,
+        obj_settings.QUARANTINE_PATH,
+        obj_settings.VALIDATION_REPORT_PATH,
+    ]
 
 
 def get(config):
-    return os.environ.get(config, _default.get(config, ""))
+    if config not in Settings._fields:
+        return ""
+    return getattr(settings(), config)
@@ -0,0 +1,194 @@
+""" module to export journal and article data with asyncio, for the harvests
+with thousands of requests in flight.
+
+aiohttp is an optional dependency, installed with the `async` extra """
+import json
+import asyncio
+from urllib.parse import urlparse
+
+from documentstore_migracao import config
+from documentstore_migracao.utils import metrics
+from documentstore_migracao.utils.request import RETRY_STATUS, is_last_page
+
+
+def import_aiohttp():
+
+    try:
+        import aiohttp
+    except ImportError:
+        raise RuntimeError(
+            "O cliente assíncrono precisa do aiohttp: "
+            "pip install documentstore-migracao[async]"
+        ) from None
+    return aiohttp
+
+
+class ArticleMetaClient:
+    """ asyncio client of the ArticleMeta API, with a pool of up to
+    `max_requests` connections and a semaphore that bounds the requests in
+    flight to each host. It must be used as an async context manager """
+
+    def __init__(self, max_requests=None, max_per_host=None):
+        self.max_requests = max_requests or config.get("ASYNC_MAX_REQUESTS")
+        self.max_per_host = max_per_host or config.get("ASYNC_MAX_PER_HOST")
+        self.session = None
+        self._hosts_semaphore = {}
+
+    async def __aenter__(self):
+        aiohttp = import_aiohttp()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_requests),
+            timeout=aiohttp.ClientTimeout(total=config.get("REQUEST_TIMEOUT")),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    def host_semaphore(self, uri):
+
+        host = urlparse(uri).netloc
+        if host not in self._hosts_semaphore:
+            self._hosts_semaphore[host] = asyncio.Semaphore(self.max_per_host)
+        return self._hosts_semaphore[host]
+
+    async def get_once(self, uri, params, retry_status=()):
+        """ text of the response, or None if its status is in retry_status """
+
+        async with self.host_semaphore(uri):
+            with metrics.METRICS.timer("http_request_seconds"):
+                async with self.session.get(uri, params=params) as response:
+                    if response.status in retry_status:
+                        return None
+                    response.raise_for_status()
+                    return await response.text()
+
+    async def get(self, uri, params=None):
+        """ text of the response, retrying the connection errors and the
+        RETRY_STATUS responses with exponential backoff """
+
+        aiohttp = import_aiohttp()
+        params = {key: str(value) for key, value in (params or {}).items()}
+        retries = config.get("REQUEST_RETRIES")
+
+        for attempt in range(retries + 1):
+            metrics.METRICS.inc("http_requests")
+            retry_status = RETRY_STATUS if attempt < retries else ()
+            try:
+                text = await self.get_once(uri, params, retry_status)
+            except aiohttp.ClientResponseError:
+                metrics.METRICS.inc("http_errors")
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == retries:
+                    metrics.METRICS.inc("http_errors")
+                    raise
+                text = None
+
+            if text is not None:
+                metrics.METRICS.inc("http_bytes", len(text))
+                return text
+
+            metrics.METRICS.inc("http_retries")
+            await asyncio.sleep(config.get("REQUEST_BACKOFF_FACTOR") * 2 ** attempt)
+
+    async def get_json(self, uri, params=None):
+        return json.loads(await self.get(uri, params))
+
+    async def iter_pages(self, fetch_page, page_size):
+        """ async generator of the "objects" of a paginated listing, as
+        request.iter_pages """
+
+        offset = 0
+        while True:
+            page = await fetch_page(offset, page_size)
+            objects = page.get("objects", [])
+            for obj in objects:
+                yield obj
+
+            offset += len(objects)
+            if is_last_page(page, offset, page_size):
+                break
+
+    async def ext_journal_identifiers(self, **ext_params):
+        params = {"collection": config.get("SCIELO_COLLECTION")}
+        params.update(ext_params)
+
+        return await self.get_json(
+            "%s/journal/identifiers/" % config.get("AM_URL_API"), params=params
+        )
+
+    def iter_journal_identifiers(self):
+        async def fetch_page(offset, limit):
+            return await self.ext_journal_identifiers(offset=offset, limit=limit)
+
+        return self.iter_pages(fetch_page, config.get("AM_PAGE_SIZE"))
+
+    async def ext_journal(self, issn):
+        from xylose.scielodocument import Journal
+
+        journal = await self.get_json(
+            "%s/journal" % config.get("AM_URL_API"),
+            params={"collection": config.get("SCIELO_COLLECTION"), "issn": issn},
+        )
+        metrics.METRICS.inc("export_journals")
+        return Journal(journal[0])
+
+    async def iter_all_journal(self, issns=None, exclude_issns=None):
+        """ async generator of the journals of the collection, or of the ones
+        of issns, as journal.iter_all_journal """
+
+        exclude_issns = set(exclude_issns or ())
+        if issns is None:
+            issns = [
+                d_journal["code"] async for d_journal in self.iter_journal_identifiers()
+            ]
+
+        for issn in issns:
+            if issn not in exclude_issns:
+                yield await self.ext_journal(issn)
+
+    async def ext_article_identifiers(self, issn_journal, **ext_params):
+        params = {"collection": config.get("SCIELO_COLLECTION"), "issn": issn_journal}
+        params.update(ext_params)
+
+        return await self.get_json(
+            "%s/article/identifiers/" % config.get("AM_URL_API"), params=params
+        )
+
+    def iter_article_identifiers(self, issn_journal, from_date=None, until_date=None):
+        filters = {}
+        if from_date:
+            filters["from"] = from_date
+        if until_date:
+            filters["until"] = until_date
+
+        async def fetch_page(offset, limit):
+            return await self.ext_article_identifiers(
+                issn_journal, offset=offset, limit=limit, **filters
+            )
+
+        return self.iter_pages(fetch_page, config.get("AM_PAGE_SIZE"))
+
+    async def ext_article(self, code, **ext_params):
+        params = ext_params
+        params.update({"collection": config.get("SCIELO_COLLECTION"), "code": code})
+
+        return await self.get("%s/article" % config.get("AM_URL_API"), params=params)
+
+    async def ext_article_json(self, code, **ext_params):
+        return json.loads(await self.ext_article(code, **ext_params))
+
+    async def ext_article_txt(self, code, **ext_params):
+        return await self.ext_article(code, body="true", format="xmlrsps", **ext_params)
+
+    async def ext_article_with_version(self, code, version=None):
+        """ as article.ext_article_with_version """
+
+        if version is None:
+            version = (await self.ext_article_json(code))["version"]
+
+        if version != "xml":
+            return version, await self.ext_article_txt(code)
+
+        return version, None
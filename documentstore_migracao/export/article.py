@@ -1,19 +1,39 @@
 """ module to export article data """
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from documentstore_migracao import config
-from documentstore_migracao.utils import request
+from documentstore_migracao.utils import request, parallel, metrics
 
 logger = logging.getLogger(__name__)
 
 
-def ext_identifiers(issn_journal):
+def ext_identifiers(issn_journal, **ext_params):
+    params = {"collection": config.get("SCIELO_COLLECTION"), "issn": issn_journal}
+    params.update(ext_params)
+
     articles_id = request.get(
-        "%s/article/identifiers/" % config.get("AM_URL_API"),
-        params={"collection": config.get("SCIELO_COLLECTION"), "issn": issn_journal},
+        "%s/article/identifiers/" % config.get("AM_URL_API"), params=params
     ).json()
     return articles_id
 
 
+def iter_identifiers(issn_journal, from_date=None, until_date=None):
+    """ generator of the identifiers of the journal articles, page by page,
+    optionally filtered by the processing date (YYYY-MM-DD) """
+
+    filters = {}
+    if from_date:
+        filters["from"] = from_date
+    if until_date:
+        filters["until"] = until_date
+
+    def fetch_page(offset, limit):
+        return ext_identifiers(issn_journal, offset=offset, limit=limit, **filters)
+
+    return request.iter_pages(fetch_page, config.get("AM_PAGE_SIZE"))
+
+
 def ext_article(code, **ext_params):
     params = ext_params
     params.update({"collection": config.get("SCIELO_COLLECTION"), "code": code})
@@ -32,14 +52,105 @@ def ext_article_txt(code, **ext_params):
     return article
 
 
-def get_all_articles_notXML(issn):
+def ext_article_with_version(code, version=None):
+    """ returns the version of the article and its XML, the XML is None if
+    the article is already a XML article. A known version avoids the
+    request of the article metadata, an unknown one costs an extra request """
+
+    if version is None:
+        version = ext_article_json(code)["version"]
+
+    if version != "xml":
+        return version, ext_article_txt(code)
+
+    return version, None
+
+
+def iter_articles(
+    issn, max_workers=None, from_date=None, until_date=None, skip=None, versions=None
+):
+    """ generator of (identifier, version, xml) of the journal articles,
+    fetched by a pool of threads and yielded as soon as they are downloaded.
+
+    The articles whose identifier satisfies skip(identifier) are not fetched
+    and versions(code) may return the already known version of an article.
+    The identifiers listing does not carry the version, so the articles that
+    versions does not know still cost two requests """
 
-    articles = []
-    articles_id = ext_identifiers(issn)
-    for d_articles in articles_id["objects"]:
-        article = ext_article_json(d_articles["code"])
-        if article["version"] != "xml":
-            logger.info("\t Arquivo XML '%s' extraido", d_articles["code"])
-            articles.append((d_articles["code"], ext_article_txt(d_articles["code"])))
+    for _, d_article, version, xml_article in iter_journals_articles(
+        [issn],
+        max_workers=max_workers,
+        max_journals=1,
+        from_date=from_date,
+        until_date=until_date,
+        skip=skip,
+        versions=versions,
+    ):
+        yield d_article, version, xml_article
+
+
+def iter_journals_articles(
+    issns,
+    max_workers=None,
+    max_journals=None,
+    from_date=None,
+    until_date=None,
+    skip=None,
+    versions=None,
+):
+    """ generator of (issn, identifier, version, xml) of the articles of
+    several journals, fetched by a single pool of `max_workers` threads.
+
+    Up to `max_journals` journals are harvested at a time and their articles
+    are requested in turns, so that a large journal does not hold back the
+    small ones. `issns` is consumed lazily, as the journals are finished """
+
+    if max_workers is None:
+        max_workers = config.get("THREADPOOL_MAX_WORKERS")
+    if max_journals is None:
+        max_journals = config.get("EXTRACTION_MAX_JOURNALS")
+
+    def journal_identifiers(issn):
+        for d_article in iter_identifiers(issn, from_date, until_date):
+            if skip is None or not skip(d_article):
+                yield issn, d_article
+
+    # a versao conhecida e consultada aqui, fora das threads
+    items = (
+        (issn, d_article, versions(d_article["code"]) if versions is not None else None)
+        for issn, d_article in parallel.round_robin(
+            (journal_identifiers(issn) for issn in issns), max_journals
+        )
+    )
+
+    def fetch(item):
+        _, d_article, version = item
+        with metrics.METRICS.timer("export_article_seconds"):
+            return ext_article_with_version(d_article["code"], version)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (issn, d_article, _), (version, xml_article) in parallel.imap_unordered(
+            executor,
+            fetch,
+            items,
+            max_pending=max_workers * config.get("PENDING_PER_WORKER"),
+        ):
+            metrics.METRICS.inc("export_articles")
+            if xml_article is not None:
+                logger.info("\t Arquivo XML '%s' extraido", d_article["code"])
+            yield issn, d_article, version, xml_article
+
+
+def iter_articles_notXML(issn, max_workers=None, from_date=None, until_date=None):
+    """ generator of (code, xml) of the articles not in XML of the journal """
+
+    for d_article, version, xml_article in iter_articles(
+        issn, max_workers=max_workers, from_date=from_date, until_date=until_date
+    ):
+        if xml_article is not None:
+            yield d_article["code"], xml_article
+
+
+def get_all_articles_notXML(issn):
 
-    return articles
+    return list(iter_articles_notXML(issn))
@@ -1,33 +1,52 @@
 """ module to export journal data """
-
 from xylose.scielodocument import Journal
 from documentstore_migracao import config
-from documentstore_migracao.utils import request
+from documentstore_migracao.utils import request, metrics
 
 
-def ext_identifiers():
+def ext_identifiers(**ext_params):
+    params = {"collection": config.get("SCIELO_COLLECTION")}
+    params.update(ext_params)
 
     journals_id = request.get(
-        "%s/journal/identifiers/" % config.get("AM_URL_API"),
-        params={"collection": config.get("SCIELO_COLLECTION")},
+        "%s/journal/identifiers/" % config.get("AM_URL_API"), params=params
     ).json()
     return journals_id
 
 
+def iter_identifiers():
+    """ generator of the identifiers of the collection journals, page by page """
+
+    def fetch_page(offset, limit):
+        return ext_identifiers(offset=offset, limit=limit)
+
+    return request.iter_pages(fetch_page, config.get("AM_PAGE_SIZE"))
+
+
 def ext_journal(issn):
 
     journal = request.get(
         "%s/journal" % config.get("AM_URL_API"),
         params={"collection": config.get("SCIELO_COLLECTION"), "issn": issn},
     ).json()
+    metrics.METRICS.inc("export_journals")
     return Journal(journal[0])
 
 
-def get_all_journal():
+def iter_all_journal(issns=None, exclude_issns=None):
+    """ generator of the journals of the collection, or of the ones of
+    issns, fetched one at a time. The journals of exclude_issns are left out
+    before their data is requested """
+
+    if issns is None:
+        issns = (d_journal["code"] for d_journal in iter_identifiers())
+
+    exclude_issns = set(exclude_issns or ())
+    for issn in issns:
+        if issn not in exclude_issns:
+            yield ext_journal(issn)
 
-    journals = []
-    journals_id = ext_identifiers()
-    for d_journal in journals_id["objects"][2:]:
-        journals.append(ext_journal(d_journal["code"]))
 
-    return journals
+def get_all_journal():
+
+    return list(iter_all_journal())
@@ -1,19 +1,57 @@
 """ module to methods to main  """
-import pkg_resources
 import argparse
 import sys
 import os, logging
 
-
-from documentstore_migracao.processing import extrated, reading, conversion
+from documentstore_migracao.utils import metrics
+from documentstore_migracao.utils.logger import configure_logger, configure_bulk_logger
+from documentstore_migracao import config
 
 logger = logging.getLogger(__name__)
 
+_setup_done = False
+
+
+def setup():
+    """ configures the logger and creates the processing folders, only once """
+
+    global _setup_done
+
+    if not _setup_done:
+        from documentstore_migracao.utils import files
+
+        configure_logger()
+        files.setup_processing_folder()
+        _setup_done = True
+
+
+def get_version():
+
+    try:
+        from importlib.metadata import version
+    except ImportError:  # python < 3.8
+        import pkg_resources
+
+        return pkg_resources.get_distribution("documentstore-migracao").version
+    return version("documentstore-migracao")
+
+
+class VersionAction(argparse.Action):
+    """ prints the version of the package, that is only looked up when asked """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0, help=help
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(get_version())
+        parser.exit()
+
 
 def process(args):
     """ method to main process """
 
-    packtools_version = pkg_resources.get_distribution("documentstore-migracao").version
     parser = argparse.ArgumentParser(description="Document Store (Kernel) - Migração")
 
     parser.add_argument(
@@ -22,6 +60,12 @@ def process(args):
         action="store_true",
         help="Baixa todos os XML dos periodicos",
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Usa o cliente assíncrono (aiohttp) na extração dos arquivos",
+    )
     parser.add_argument(
         "--readFiles",
         "-r",
@@ -34,40 +78,207 @@ def process(args):
         action="store_true",
         help="Converte somente os arquivos XML baixados",
     )
+    parser.add_argument(
+        "--validateFiles",
+        "-a",
+        action="store_true",
+        help="Valida os arquivos XML convertidos com o packtools",
+    )
 
     parser.add_argument(
-        "--issn-journal", "-j", help="Processa somente o journal informado"
+        "--pipeline",
+        action="store_true",
+        help="Extrai, converte e lê cada artigo, retomando a execução interrompida",
+    )
+
+    parser.add_argument(
+        "--issn-journal",
+        "-j",
+        action="append",
+        help="Processa somente o journal informado, pode ser repetido",
+    )
+    parser.add_argument(
+        "--issn-file", help="Processa somente os journals do arquivo, um por linha"
+    )
+    parser.add_argument(
+        "--exclude-issn",
+        action="append",
+        help="Não processa o journal informado, pode ser repetido",
+    )
+    parser.add_argument(
+        "--exclude-issn-file", help="Não processa os journals do arquivo, um por linha"
+    )
+    parser.add_argument(
+        "--max-journals",
+        type=int,
+        help="Quantidade de journals extraídos ao mesmo tempo, que dividem "
+        "as requisições simultâneas",
     )
     parser.add_argument(
         "--pathFile", "-p", help="Transformar somente o arquivos XML imformado"
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Quantidade de requisições simultâneas na extração dos artigos "
+        "ou de processos na conversão, na validação e na leitura",
+    )
+    parser.add_argument(
+        "--from-date",
+        help="Extrai somente os artigos processados a partir da data (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--until-date",
+        help="Extrai somente os artigos processados até a data (YYYY-MM-DD)",
+    )
 
-    parser.add_argument("--version", "-v", action="version", version=packtools_version)
+    parser.add_argument(
+        "--metrics-file",
+        help="Grava as métricas da execução em JSON, ou no formato do "
+        "Prometheus se o arquivo terminar em .prom",
+    )
+
+    parser.add_argument("--version", "-v", action=VersionAction)
     parser.add_argument("--loglevel", default="WARNING")
+    parser.add_argument(
+        "--config",
+        help="Arquivo INI com as configurações na seção [documentstore_migracao], "
+        "as variáveis de ambiente têm precedência",
+    )
+    parser.add_argument(
+        "--bulk-log",
+        action="store_true",
+        help="Log em segundo plano e com amostragem, para execuções longas",
+    )
 
     args = parser.parse_args(args)
+    if args.config:
+        config.configure(args.config)
+    setup()
 
     # CHANGE LOGGER
     level = getattr(logging, args.loglevel.upper())
     logger = logging.getLogger()
     logger.setLevel(level)
 
-    if args.readFiles:
-        reading.reading_article_ALLxml()
+    listener = None
+    if args.bulk_log or config.get("LOGGER_BULK"):
+        listener = configure_bulk_logger()
+
+    try:
+        with metrics.report_progress(config.get("METRICS_INTERVAL")):
+            run(args)
+    finally:
+        if listener is not None:
+            listener.stop()
+
+    metrics_path = args.metrics_file or config.get("METRICS_PATH")
+    if metrics_path:
+        metrics.METRICS.dump(metrics_path)
+
+    return 0
+
+
+def journal_filters(args):
+    """ the ISSNs of the journals to process, None for all the journals of
+    the collection, and of the ones to leave out, from the -j values and the
+    files of the arguments """
+
+    from documentstore_migracao.utils import files
+
+    exclude_issns = list(args.exclude_issn or [])
+    if args.exclude_issn_file:
+        exclude_issns.extend(files.read_lines(args.exclude_issn_file))
+
+    issns = None
+    if args.issn_journal or args.issn_file:
+        issns = list(args.issn_journal or [])
+        if args.issn_file:
+            issns.extend(files.read_lines(args.issn_file))
+        issns = [issn for issn in issns if issn not in exclude_issns]
+
+    return issns, exclude_issns or None
+
+
+def run(args):
+    """ runs the command chosen in the arguments """
+
+    issns, exclude_issns = journal_filters(args)
+
+    if args.pipeline:
+        from documentstore_migracao.processing import pipeline
+
+        pipeline.pipeline_all_data(
+            issns=issns,
+            exclude_issns=exclude_issns,
+            max_workers=args.workers,
+            max_journals=args.max_journals,
+            workers=args.workers,
+            from_date=args.from_date,
+            until_date=args.until_date,
+        )
+
+    elif args.readFiles:
+        from documentstore_migracao.processing import reading
+
+        reading.reading_article_ALLxml(workers=args.workers)
 
     elif args.conversionFiles:
-        conversion.conversion_article_ALLxml()
+        from documentstore_migracao.processing import conversion
+
+        conversion.conversion_article_ALLxml(workers=args.workers)
+
+    elif args.validateFiles:
+        from documentstore_migracao.processing import validation
+
+        validation.validation_article_ALLxml(workers=args.workers)
 
     elif args.extrateFiles:
-        extrated.extrated_all_data()
+        from documentstore_migracao.processing import extrated
+
+        if args.use_async:
+            extrated.extrated_all_data_async(
+                max_requests=args.workers,
+                from_date=args.from_date,
+                until_date=args.until_date,
+                issns=issns,
+                exclude_issns=exclude_issns,
+            )
+        else:
+            extrated.extrated_all_data(
+                max_workers=args.workers,
+                from_date=args.from_date,
+                until_date=args.until_date,
+                issns=issns,
+                exclude_issns=exclude_issns,
+                max_journals=args.max_journals,
+            )
 
     elif args.pathFile:
+        from documentstore_migracao.processing import conversion
+
         conversion.conversion_article_xml(args.pathFile)
 
-    elif args.issn_journal:
-        extrated.extrated_selected_journal(args.issn_journal)
+    elif issns:
+        from documentstore_migracao.processing import extrated
 
-    return 0
+        if len(issns) == 1:
+            extrated.extrated_selected_journal(
+                issns[0],
+                max_workers=args.workers,
+                from_date=args.from_date,
+                until_date=args.until_date,
+            )
+        else:
+            extrated.extrated_all_data(
+                max_workers=args.workers,
+                from_date=args.from_date,
+                until_date=args.until_date,
+                issns=issns,
+                exclude_issns=exclude_issns,
+                max_journals=args.max_journals,
+            )
 
 
 def main():
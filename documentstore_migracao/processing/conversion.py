@@ -1,17 +1,42 @@
 import os
+import inspect
+import hashlib
 import logging
+from contextlib import closing
+from collections import Counter
 
-from lxml import etree
-from documentstore_migracao.utils import files, xml
+from documentstore_migracao.utils import (
+    files,
+    xml,
+    manifest,
+    parallel,
+    metrics,
+    convert_html_body,
+)
 from documentstore_migracao import config
 
 logger = logging.getLogger(__name__)
 
+_converter_version = None
 
-def conversion_article_xml(file_xml_path):
-    article = files.read_file(file_xml_path)
 
-    obj_xml = etree.fromstring(article)
+def converter_version():
+    """ hash of the code that converts the body, any change to the tags or to
+    the handlers of Convert2SPSBody invalidates the converted files """
+
+    global _converter_version
+
+    if _converter_version is None:
+        sha1 = hashlib.sha1()
+        sha1.update(repr(convert_html_body.Convert2SPSBody.parser_tags).encode())
+        for module in (convert_html_body, xml):
+            sha1.update(inspect.getsource(module).encode("utf-8"))
+        _converter_version = sha1.hexdigest()
+    return _converter_version
+
+
+def conversion_article_xml(file_xml_path):
+    obj_xml = files.read_xml(file_xml_path)
     obj_html_body = xml.parser_body_xml(obj_xml)
 
     # sobrecreve o html escapado anterior pelo novo xml tratado
@@ -19,21 +44,109 @@ def conversion_article_xml(file_xml_path):
     remove.getparent().replace(remove, obj_html_body)
 
     new_file_xml_path = os.path.join(
-        config.get("CONVERSION_PATH"), os.path.split(file_xml_path)[1]
+        config.get("CONVERSION_PATH"),
+        files.relative_path(file_xml_path, config.get("SOURCE_PATH")),
     )
-    files.write_file(new_file_xml_path, etree.tostring(obj_xml).decode("utf-8"))
+    os.makedirs(os.path.dirname(new_file_xml_path), exist_ok=True)
+    files.write_xml(new_file_xml_path, obj_xml)
+
+
+def _conversion_article_xml(file_xml_path):
+    """ converts the file returning the error message instead of raising it,
+    so that one file does not abort the whole batch, and the parsers used
+    for its body """
+
+    parse_stats = Counter(xml.PARSE_STATS)
+    error = None
+    try:
+        conversion_article_xml(file_xml_path)
+    except Exception as ex:
+        logger.error(file_xml_path)
+        logger.exception(ex)
+        error = "%s: %s" % (type(ex).__name__, ex)
+
+    return error, xml.PARSE_STATS - parse_stats
+
 
+def conversion_article_ALLxml(workers=None):
+    """ converts all the files of SOURCE_PATH, spread over `workers`
+    processes, and returns the summary with the files that failed.
 
-def conversion_article_ALLxml():
+    The files are streamed from the directory in chunks, and the ones already
+    converted from the same source by the same version of the converter,
+    whose output is in CONVERSION_PATH or was already read and moved to
+    SUCCESS_PROCESSING_PATH, are skipped """
+
+    if workers is None:
+        workers = config.get("PROCESSPOOL_MAX_WORKERS")
 
     logger.info("Iniciando Conversão do xmls")
-    list_files_xmls = files.list_dir(config.get("SOURCE_PATH"))
-    for file_xml in list_files_xmls:
+    source_path = config.get("SOURCE_PATH")
+    output_paths = (
+        config.get("CONVERSION_PATH"),
+        config.get("SUCCESS_PROCESSING_PATH"),
+    )
+    chunksize = config.get("PROCESSPOOL_CHUNKSIZE")
+    version = converter_version()
+
+    success = 0
+    unchanged = 0
+    failures = []
+    parse_stats = Counter()
+    checksums = {}
+
+    with closing(manifest.Manifest(config.get("MANIFEST_PATH"))) as obj_manifest:
+
+        def iter_pending():
+            nonlocal unchanged
+            for file_xml_path in files.iter_dir(source_path, recursive=True):
+                file_xml = files.relative_path(file_xml_path, source_path)
+                checksum = files.checksum(file_xml_path)
+
+                if obj_manifest.is_converted(file_xml, checksum, version) and any(
+                    os.path.isfile(os.path.join(path, file_xml))
+                    for path in output_paths
+                ):
+                    unchanged += 1
+                    metrics.METRICS.inc("conversion_unchanged")
+                    continue
 
-        try:
-            conversion_article_xml(os.path.join(config.get("SOURCE_PATH"), file_xml))
+                checksums[file_xml_path] = checksum
+                yield file_xml_path
+
+        task = metrics.MeasuredTask(_conversion_article_xml, "conversion")
+        for file_xml_path, (result, task_metrics) in parallel.imap_chunks(
+            task, iter_pending(), workers, chunksize
+        ):
+            error, file_parse_stats = result
+            checksum = checksums.pop(file_xml_path)
+            parse_stats.update(file_parse_stats)
+            metrics.METRICS.merge(task_metrics)
+            if error is not None:
+                metrics.METRICS.inc("conversion_errors")
+                failures.append((file_xml_path, error))
+                continue
+
+            success += 1
+            obj_manifest.update_conversion(
+                files.relative_path(file_xml_path, source_path), checksum, version
+            )
+
+    summary = {
+        "success": success,
+        "unchanged": unchanged,
+        "failures": failures,
+        "parsers": dict(parse_stats),
+    }
+
+    logger.info(
+        "Total de %s arquivos convertidos, %s inalterados, %s com falha",
+        success,
+        unchanged,
+        len(failures),
+    )
+    logger.info("Corpos interpretados por parser: %s", summary["parsers"])
+    for file_xml, error in failures:
+        logger.warning("Falha na conversão de '%s': %s", file_xml, error)
 
-        except Exception as ex:
-            logger.error(file_xml)
-            logger.exception(ex)
-            raise
+    return summary
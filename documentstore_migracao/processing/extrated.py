@@ -1,39 +1,256 @@
 import logging
-import os
+import asyncio
+from contextlib import closing
 from documentstore_migracao.export import journal, article
-from documentstore_migracao.utils import files
+from documentstore_migracao.utils import files, manifest, metrics
 from documentstore_migracao import config
 
 
 logger = logging.getLogger(__name__)
 
 
-def extrated_journal_data(obj_journal):
+def save_article(obj_manifest, issn, d_article, version, xml_article):
+    """ saves the XML of the article in the shard of its journal in
+    SOURCE_PATH and registers it in the manifest, returning its path or None
+    if the article has no XML to convert """
+
+    file_path = xml_checksum = None
+    if xml_article is not None:
+
+        logger.info("\t Salvando arquivo '%s'", d_article["code"])
+        file_path = files.shard_path(
+            config.get("SOURCE_PATH"), issn, "%s.xml" % d_article["code"]
+        )
+        files.write_file(file_path, xml_article)
+        xml_checksum = manifest.checksum(xml_article)
+        metrics.METRICS.inc("extraction_documents")
+        metrics.METRICS.inc("extraction_bytes", len(xml_article))
+
+    obj_manifest.update(
+        d_article["code"],
+        d_article.get("processing_date"),
+        version,
+        xml_checksum,
+        file_path,
+    )
+    return file_path
+
+
+def iter_journal_data(
+    obj_journal,
+    obj_manifest,
+    max_workers=None,
+    from_date=None,
+    until_date=None,
+    skip=None,
+):
+    """ generator of the code and path of each article of the journal saved
+    in SOURCE_PATH, registering them in the manifest.
+
+    Articles unchanged since the last extraction, or the ones for which
+    `skip(identifier)` is true, are not downloaded again. The manifest also
+    gives the version of the changed articles, only the articles it has never
+    seen need the extra metadata request """
 
     logger.info("\t coletando dados do periodico '%s'", obj_journal.title)
-    list_articles = article.get_all_articles_notXML(obj_journal.scielo_issn)
-    for name_article, xml_article in list_articles:
+    total = 0
+    unchanged = 0
+
+    def skip_article(d_article):
+        nonlocal unchanged
+        if obj_manifest.is_unchanged(d_article):
+            unchanged += 1
+            metrics.METRICS.inc("extraction_unchanged")
+            return True
+        return skip is not None and skip(d_article)
 
-        logger.info("\t Salvando arquivo '%s'", name_article)
-        files.write_file(
-            os.path.join(config.get("SOURCE_PATH"), "%s.xml" % name_article),
-            xml_article,
+    for d_article, version, xml_article in article.iter_articles(
+        obj_journal.scielo_issn,
+        max_workers=max_workers,
+        from_date=from_date,
+        until_date=until_date,
+        skip=skip_article,
+        versions=obj_manifest.get_version,
+    ):
+        file_path = save_article(
+            obj_manifest, obj_journal.scielo_issn, d_article, version, xml_article
         )
-    logger.info("\t Total de %s artigos", len(list_articles))
+        if file_path is not None:
+            total += 1
+            yield d_article["code"], file_path
+
+    logger.info("\t Total de %s artigos, %s inalterados", total, unchanged)
+
+
+def iter_journals_data(
+    obj_journals,
+    obj_manifest,
+    max_workers=None,
+    max_journals=None,
+    from_date=None,
+    until_date=None,
+    skip=None,
+):
+    """ as iter_journal_data, for several journals harvested at once by
+    article.iter_journals_articles. obj_journals is consumed lazily """
+
+    def skip_article(d_article):
+        if obj_manifest.is_unchanged(d_article):
+            metrics.METRICS.inc("extraction_unchanged")
+            return True
+        return skip is not None and skip(d_article)
+
+    def issns():
+        for obj_journal in obj_journals:
+            logger.info("\t coletando dados do periodico '%s'", obj_journal.title)
+            yield obj_journal.scielo_issn
+
+    for issn, d_article, version, xml_article in article.iter_journals_articles(
+        issns(),
+        max_workers=max_workers,
+        max_journals=max_journals,
+        from_date=from_date,
+        until_date=until_date,
+        skip=skip_article,
+        versions=obj_manifest.get_version,
+    ):
+        file_path = save_article(obj_manifest, issn, d_article, version, xml_article)
+        if file_path is not None:
+            yield d_article["code"], file_path
+
+
+def extrated_journal_data(
+    obj_journal, max_workers=None, from_date=None, until_date=None
+):
 
+    with closing(manifest.Manifest(config.get("MANIFEST_PATH"))) as obj_manifest:
+        for _ in iter_journal_data(
+            obj_journal,
+            obj_manifest,
+            max_workers=max_workers,
+            from_date=from_date,
+            until_date=until_date,
+        ):
+            pass
 
-def extrated_selected_journal(issn):
+
+def extrated_selected_journal(issn, max_workers=None, from_date=None, until_date=None):
 
     logger.info("Iniciando extração do journal %s" % issn)
 
     obj_journal = journal.ext_journal(issn)
-    extrated_journal_data(obj_journal)
+    extrated_journal_data(
+        obj_journal, max_workers=max_workers, from_date=from_date, until_date=until_date
+    )
 
 
-def extrated_all_data():
+def extrated_all_data(
+    max_workers=None,
+    from_date=None,
+    until_date=None,
+    issns=None,
+    exclude_issns=None,
+    max_journals=None,
+):
+    """ extraction of the journals of the collection, or of the ones of
+    issns, without the ones of exclude_issns. Up to max_journals journals are
+    harvested at a time, sharing the max_workers threads """
 
     logger.info("Iniciando extração")
-    list_journais = journal.get_all_journal()
-    for obj_journal in list_journais:
+    total = 0
+    with closing(manifest.Manifest(config.get("MANIFEST_PATH"))) as obj_manifest:
+        for _ in iter_journals_data(
+            journal.iter_all_journal(issns, exclude_issns),
+            obj_manifest,
+            max_workers=max_workers,
+            max_journals=max_journals,
+            from_date=from_date,
+            until_date=until_date,
+        ):
+            total += 1
+
+    logger.info("Total de %s artigos extraídos", total)
+
+
+def extrated_all_data_async(
+    max_requests=None, from_date=None, until_date=None, issns=None, exclude_issns=None
+):
+    """ extraction of the journals with the asyncio client of export.aio,
+    with up to max_requests requests in flight """
+
+    logger.info("Iniciando extração assíncrona")
+    asyncio.run(
+        _extrated_all_data_async(
+            max_requests, from_date, until_date, issns, exclude_issns
+        )
+    )
+
+
+async def _extrated_all_data_async(
+    max_requests, from_date, until_date, issns, exclude_issns
+):
+    from documentstore_migracao.export import aio
+
+    loop = asyncio.get_running_loop()
+    source_path = config.get("SOURCE_PATH")
+
+    async with aio.ArticleMetaClient(max_requests) as client:
+        with closing(manifest.Manifest(config.get("MANIFEST_PATH"))) as obj_manifest:
+
+            async def extrate(obj_journal, d_article):
+                code = d_article["code"]
+                version, xml_article = await client.ext_article_with_version(
+                    code, obj_manifest.get_version(code)
+                )
+                metrics.METRICS.inc("export_articles")
+
+                file_path = xml_checksum = None
+                if xml_article is not None:
+                    file_path = files.shard_path(
+                        source_path, obj_journal.scielo_issn, "%s.xml" % code
+                    )
+                    await loop.run_in_executor(
+                        None, files.write_file, file_path, xml_article
+                    )
+                    xml_checksum = manifest.checksum(xml_article)
+                    metrics.METRICS.inc("extraction_documents")
+                    metrics.METRICS.inc("extraction_bytes", len(xml_article))
+
+                obj_manifest.update(
+                    code,
+                    d_article.get("processing_date"),
+                    version,
+                    xml_checksum,
+                    file_path,
+                )
+
+            max_pending = client.max_requests * config.get("PENDING_PER_WORKER")
+            pending = set()
+            try:
+                async for obj_journal in client.iter_all_journal(issns, exclude_issns):
+                    logger.info(
+                        "\t coletando dados do periodico '%s'", obj_journal.title
+                    )
+                    async for d_article in client.iter_article_identifiers(
+                        obj_journal.scielo_issn, from_date, until_date
+                    ):
+                        if obj_manifest.is_unchanged(d_article):
+                            metrics.METRICS.inc("extraction_unchanged")
+                            continue
+
+                        if len(pending) >= max_pending:
+                            done, pending = await asyncio.wait(
+                                pending, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            for task in done:
+                                task.result()
+
+                        pending.add(
+                            asyncio.ensure_future(extrate(obj_journal, d_article))
+                        )
 
-        extrated_journal_data(obj_journal)
+                for task in asyncio.as_completed(pending):
+                    await task
+            finally:
+                for task in pending:
+                    task.cancel()
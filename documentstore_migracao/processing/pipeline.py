@@ -0,0 +1,186 @@
+import os
+import logging
+from contextlib import closing
+
+from documentstore_migracao.processing import conversion, validation, reading
+from documentstore_migracao.utils import files, manifest, parallel, metrics
+from documentstore_migracao import config
+
+logger = logging.getLogger(__name__)
+
+EXTRACTED = "extracted"
+DONE = "done"
+FAILED = "failed"
+
+
+def _pipeline_article_xml(file_xml_path):
+    """ converts the extracted file, validates and reads the converted one,
+    returning its medias, the number of validation errors, the error message
+    of the stage that failed and if the conversion succeeded. The validation
+    only writes its report, as in validation.validation_article_ALLxml.
+
+    A file already converted, queued from CONVERSION_PATH, is only validated
+    and read """
+
+    converted_path = file_xml_path
+    if not files.is_inside(file_xml_path, config.get("CONVERSION_PATH")):
+        error, _ = conversion._conversion_article_xml(file_xml_path)
+        if error is not None:
+            return [], 0, error, False
+
+        converted_path = os.path.join(
+            config.get("CONVERSION_PATH"),
+            files.relative_path(file_xml_path, config.get("SOURCE_PATH")),
+        )
+
+    total_errors, validation_error = validation._validation_article_xml(converted_path)
+    if validation_error is not None:
+        logger.warning("Falha na validação de '%s'", converted_path)
+
+    medias, error = reading._reading_article_xml(converted_path)
+    return medias, total_errors, error, True
+
+
+def queue_path(obj_manifest, code, file_path, version):
+    """ path to queue for the extracted article and the checksum of its
+    source, if it must be converted.
+
+    The file already converted from the same source by the same version of
+    the converter is queued from CONVERSION_PATH, to be only read, and the
+    one already read by --readFiles is marked as done and not queued """
+
+    name = files.relative_path(file_path, config.get("SOURCE_PATH"))
+    checksum = files.checksum(file_path)
+    if obj_manifest.is_converted(name, checksum, version):
+        if os.path.isfile(os.path.join(config.get("SUCCESS_PROCESSING_PATH"), name)):
+            obj_manifest.set_stage(code, DONE, file_path)
+            return None, None
+
+        converted_path = os.path.join(config.get("CONVERSION_PATH"), name)
+        if os.path.isfile(converted_path):
+            return converted_path, None
+
+    return file_path, checksum
+
+
+def pipeline_all_data(
+    issns=None,
+    exclude_issns=None,
+    max_workers=None,
+    max_journals=None,
+    workers=None,
+    from_date=None,
+    until_date=None,
+):
+    """ streams each article through extraction, conversion and reading.
+
+    The articles are converted and read by `workers` processes while the
+    next ones are still being downloaded. The stage of each article is kept
+    in the manifest, so a run that is stopped resumes with the articles
+    extracted but not done yet, even by the extraction out of the pipeline,
+    and does not download the done ones again. The conversions are recorded
+    as in conversion.conversion_article_ALLxml, and the files already
+    converted or read are not converted or read again (see queue_path).
+
+    An article that failed is only processed again when it changes in
+    ArticleMeta and is extracted again.
+
+    The journals of issns, or all the ones of the collection without the
+    ones of exclude_issns, are extracted as in extrated.extrated_all_data """
+
+    # somente este processo faz a extração, os workers não precisam dela
+    from documentstore_migracao.export import journal
+    from documentstore_migracao.processing import extrated
+
+    if workers is None:
+        workers = config.get("PROCESSPOOL_MAX_WORKERS")
+
+    logger.info("Iniciando pipeline")
+    summary = {"success": 0, "resumed": 0, "invalid": 0, "failures": []}
+
+    obj_manifest = manifest.Manifest(config.get("MANIFEST_PATH"))
+    media_file = open(config.get("MEDIA_MANIFEST_PATH"), "a", encoding="utf-8")
+    with closing(obj_manifest), media_file, parallel.executor(workers) as executor:
+
+        version = conversion.converter_version()
+        # caminho na fila -> (codigo, arquivo extraido, checksum se convertido)
+        queued = {}
+
+        def queue(code, file_path):
+            path, checksum = queue_path(obj_manifest, code, file_path, version)
+            if path is not None:
+                queued[path] = (code, file_path, checksum)
+            return path
+
+        pending = [
+            path
+            for path in (
+                queue(row["code"], row["path"])
+                for row in obj_manifest.list_unfinished([DONE, FAILED])
+                if os.path.isfile(row["path"])
+            )
+            if path is not None
+        ]
+        pending_codes = {code for code, _, _ in queued.values()}
+        summary["resumed"] = len(pending)
+        if pending:
+            logger.info("Retomando %s artigos extraídos", len(pending))
+
+        def iter_extracted():
+            yield from pending
+
+            for code, file_path in extrated.iter_journals_data(
+                journal.iter_all_journal(issns, exclude_issns),
+                obj_manifest,
+                max_workers=max_workers,
+                max_journals=max_journals,
+                from_date=from_date,
+                until_date=until_date,
+                skip=lambda d_article: d_article["code"] in pending_codes,
+            ):
+                obj_manifest.set_stage(code, EXTRACTED, file_path)
+                path = queue(code, file_path)
+                if path is not None:
+                    yield path
+
+        for path, (result, task_metrics) in parallel.imap_unordered(
+            executor,
+            metrics.MeasuredTask(_pipeline_article_xml, "pipeline"),
+            iter_extracted(),
+            max_pending=workers * config.get("PENDING_PER_WORKER"),
+        ):
+            medias, total_errors, error, converted = result
+            code, file_xml_path, checksum = queued.pop(path)
+            metrics.METRICS.merge(task_metrics)
+            if converted and checksum is not None:
+                obj_manifest.update_conversion(
+                    files.relative_path(file_xml_path, config.get("SOURCE_PATH")),
+                    checksum,
+                    version,
+                )
+            if total_errors:
+                metrics.METRICS.inc("validation_invalid")
+                summary["invalid"] += 1
+            if error is not None:
+                metrics.METRICS.inc("pipeline_errors")
+                obj_manifest.set_stage(code, FAILED, file_xml_path, error)
+                summary["failures"].append((file_xml_path, error))
+                continue
+
+            files.append_jsonl(
+                media_file, [dict(media, article=code) for media in medias]
+            )
+            obj_manifest.set_stage(code, DONE, file_xml_path)
+            summary["success"] += 1
+
+    logger.info(
+        "Total de %s artigos processados, %s retomados, %s inválidos e %s com falha",
+        summary["success"],
+        summary["resumed"],
+        summary["invalid"],
+        len(summary["failures"]),
+    )
+    for file_xml, error in summary["failures"]:
+        logger.warning("Falha no processamento de '%s': %s", file_xml, error)
+
+    return summary
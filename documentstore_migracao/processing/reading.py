@@ -1,8 +1,7 @@
 import os
 import logging
 
-from lxml import etree
-from documentstore_migracao.utils import files, xml
+from documentstore_migracao.utils import files, xml, parallel, metrics
 from documentstore_migracao import config
 
 
@@ -11,8 +10,7 @@ logger = logging.getLogger(__name__)
 
 def reading_article_xml(file_xml_path, move_success=True):
 
-    article = files.read_file(file_xml_path)
-    obj_xml = etree.fromstring(article)
+    obj_xml = files.read_xml(file_xml_path)
     medias = xml.find_medias(obj_xml)
 
     if medias:
@@ -20,22 +18,80 @@ def reading_article_xml(file_xml_path, move_success=True):
 
     if move_success:
         files.move_xml_conversion2success(
-            file_xml_path.replace(config.get("CONVERSION_PATH"), "")
+            files.relative_path(file_xml_path, config.get("CONVERSION_PATH"))
         )
 
+    return medias
 
-def reading_article_ALLxml():
 
-    logger.info("Iniciando Leituras do xmls")
-    list_files_xmls = files.list_dir(config.get("CONVERSION_PATH"))
-    for file_xml in list_files_xmls:
+def _reading_article_xml(file_xml_path):
+    """ reads the file moving it to the success folder, or to the quarantine
+    if it fails, and returns its medias and the error message """
+
+    try:
+        return reading_article_xml(file_xml_path, move_success=True), None
 
+    except Exception as ex:
+        logger.error(file_xml_path)
+        logger.exception(ex)
         try:
-            reading_article_xml(
-                os.path.join(config.get("CONVERSION_PATH"), file_xml),
-                move_success=False,
+            files.move_xml_conversion2quarantine(
+                files.relative_path(file_xml_path, config.get("CONVERSION_PATH"))
             )
+        except OSError as move_ex:
+            logger.exception(move_ex)
+        return [], "%s: %s" % (type(ex).__name__, ex)
+
+
+def reading_article_ALLxml(workers=None):
+    """ reads all the converted files, spread over `workers` processes, and
+    appends the medias (article, kind and path) of the files read to
+    MEDIA_MANIFEST_PATH, in one batched write by chunk of
+    PROCESSPOOL_CHUNKSIZE files.
+
+    Each file leaves CONVERSION_PATH when it is read, so a new run only
+    reads the files left behind and keeps the medias of the ones already
+    read. A run that is stopped loses at most the medias of one chunk """
+
+    if workers is None:
+        workers = config.get("PROCESSPOOL_MAX_WORKERS")
+
+    chunksize = config.get("PROCESSPOOL_CHUNKSIZE")
+    logger.info("Iniciando Leituras do xmls")
+    total_medias = 0
+    success = 0
+    failures = []
+    media_rows = []
+    media_file = open(config.get("MEDIA_MANIFEST_PATH"), "a", encoding="utf-8")
+    with media_file:
+        for file_xml, ((medias, error), task_metrics) in parallel.imap_chunks(
+            metrics.MeasuredTask(_reading_article_xml, "reading"),
+            files.iter_dir(config.get("CONVERSION_PATH"), recursive=True),
+            workers,
+            chunksize,
+        ):
+            metrics.METRICS.merge(task_metrics)
+            if error is not None:
+                metrics.METRICS.inc("reading_errors")
+                failures.append((file_xml, error))
+                continue
+
+            success += 1
+            total_medias += len(medias)
+            metrics.METRICS.inc("reading_medias", len(medias))
+            article = os.path.splitext(os.path.basename(file_xml))[0]
+            media_rows.extend(dict(media, article=article) for media in medias)
+            if success % chunksize == 0:
+                files.append_jsonl(media_file, media_rows)
+                media_rows = []
+
+        files.append_jsonl(media_file, media_rows)
+
+    logger.info(
+        "Total de %s arquivos lidos, %s com falha e %s midias",
+        success,
+        len(failures),
+        total_medias,
+    )
 
-        except Exception as ex:
-            logger.error(file_xml)
-            logger.exception(ex)
+    return {"success": success, "failures": failures, "medias": total_medias}
@@ -0,0 +1,131 @@
+import os
+import json
+import logging
+
+import packtools
+from packtools import catalogs
+from packtools.domain import SchematronValidator, PyValidator
+from lxml import etree
+
+from documentstore_migracao.utils import files, parallel, metrics
+from documentstore_migracao import config
+
+logger = logging.getLogger(__name__)
+
+DTD_NAME = "JATS-journalpublishing1.dtd"
+
+# DTD e validadores de estilo carregados uma vez por processo
+_validators = {}
+
+
+def get_validators(sps_version):
+    """ DTD and style validators of the sps_version, loaded only once in each
+    process and reused for all the files it validates """
+
+    if sps_version not in _validators:
+        logger.debug("Carregando DTD e schematron de %s", sps_version)
+        label = "@" + sps_version
+        _validators[sps_version] = (
+            etree.DTD(catalogs.DTDS[DTD_NAME]),
+            [
+                SchematronValidator.from_catalog(sps_version, label=label),
+                PyValidator(label=label),
+            ],
+        )
+    return _validators[sps_version]
+
+
+def format_error(error):
+    return {
+        "line": getattr(error, "line", None),
+        "level": getattr(error, "level_name", None),
+        "message": getattr(error, "message", str(error)),
+    }
+
+
+def validation_article_xml(file_xml_path):
+    """ validates the file against the DTD and the style rules of its sps
+    version, returning the list of errors found """
+
+    obj_et = etree.parse(file_xml_path)
+    sps_version = obj_et.getroot().get("specific-use")
+    if not sps_version:
+        raise ValueError("specific-use não informado em %s" % file_xml_path)
+
+    # os arquivos convertidos não tem DOCTYPE, a DTD é informada diretamente
+    dtd, style_validators = get_validators(sps_version)
+    validator = packtools.XMLValidator(
+        obj_et, dtd=dtd, style_validators=style_validators
+    )
+    _, errors = validator.validate_all()
+    return [format_error(error) for error in errors]
+
+
+def report_path(file_xml_path):
+    name = files.relative_path(file_xml_path, config.get("CONVERSION_PATH"))
+    return os.path.join(
+        config.get("VALIDATION_REPORT_PATH"), os.path.splitext(name)[0] + ".json"
+    )
+
+
+def _validation_article_xml(file_xml_path):
+    """ validates the file writing its report if there are errors, and
+    returns the number of errors found and the error message if the file
+    could not be validated """
+
+    try:
+        errors = validation_article_xml(file_xml_path)
+    except Exception as ex:
+        logger.error(file_xml_path)
+        logger.exception(ex)
+        return 0, "%s: %s" % (type(ex).__name__, ex)
+
+    path = report_path(file_xml_path)
+    if errors:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"file": file_xml_path, "errors": errors}, file)
+    elif os.path.exists(path):
+        os.remove(path)
+
+    return len(errors), None
+
+
+def validation_article_ALLxml(workers=None):
+    """ validates all the converted files, spread over `workers` processes,
+    writing one report for each invalid file in VALIDATION_REPORT_PATH.
+
+    The files stay in CONVERSION_PATH, the reports only point out what the
+    conversion still does not generate according to SPS """
+
+    if workers is None:
+        workers = config.get("PROCESSPOOL_MAX_WORKERS")
+
+    logger.info("Iniciando Validação dos xmls")
+    valid = 0
+    invalid = 0
+    failures = []
+    for file_xml, ((total_errors, error), task_metrics) in parallel.imap_chunks(
+        metrics.MeasuredTask(_validation_article_xml, "validation"),
+        files.iter_dir(config.get("CONVERSION_PATH"), recursive=True),
+        workers,
+        config.get("PROCESSPOOL_CHUNKSIZE"),
+    ):
+        metrics.METRICS.merge(task_metrics)
+        if error is not None:
+            metrics.METRICS.inc("validation_errors")
+            failures.append((file_xml, error))
+        elif total_errors:
+            metrics.METRICS.inc("validation_invalid")
+            invalid += 1
+        else:
+            valid += 1
+
+    logger.info(
+        "Total de %s arquivos válidos, %s inválidos e %s com falha",
+        valid,
+        invalid,
+        len(failures),
+    )
+
+    return {"valid": valid, "invalid": invalid, "failures": failures}
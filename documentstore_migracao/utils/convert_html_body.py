@@ -10,21 +10,54 @@ class Convert2SPSBody:
 
     parser_tags = ("p", "div", "img", "li", "ol", "ul", "i", "b", "a")
 
+    # ref-type do xref de acordo com a tag do elemento referenciado
+    ref_types = {
+        "fn": "fn",
+        "table-fn": "table-fn",
+        "ref": "bibr",
+        "table": "table",
+        "table-wrap": "table",
+        "fig": "fig",
+        "img": "fig",
+        "graphic": "fig",
+        "div": "sec",
+        "sec": "sec",
+        "aff": "aff",
+        "corresp": "corresp",
+        "disp-formula": "disp-formula",
+        "app": "app",
+    }
+
     def __init__(self, str_xml):
         self.obj_xml = xml.str2objXML(str_xml)
+        self._ids_root = None
+        self._ids = {}
+
+    def get_element_by_id(self, node, _id):
+        """ element of the document of node with the id, from an index built
+        once per document """
+
+        root = node.getroottree().getroot()
+        if root is not self._ids_root:
+            self._ids_root = root
+            self._ids = {}
+            for element in root.iterfind(".//*[@id]"):
+                self._ids.setdefault(element.get("id"), element)
+
+        return self._ids.get(_id)
 
     def get_body_element(self):
         self.process()
         return self.obj_xml
 
     def process(self):
-        for tag in self.parser_tags:
-            logger.info("buscando tag '%s'", tag)
-            nodes = self.obj_xml.findall(".//%s" % tag)
+        handlers = {tag: getattr(self, "parser_%s" % tag) for tag in self.parser_tags}
 
-            for node in nodes:
-                getattr(self, "parser_%s" % tag)(node)
-            logger.info("Total de %s tags processadas", len(nodes))
+        # os nodes sao coletados antes pois o parser_a pode remover nodes
+        nodes = list(self.obj_xml.iterdescendants(*self.parser_tags))
+        for node in nodes:
+            handlers[node.tag](node)
+        logger.info("Total de %s tags processadas", len(nodes))
 
     def parser_p(self, node):
         node.attrib.clear()
@@ -84,15 +117,11 @@ class Convert2SPSBody:
         elif "#" in href:
             node.tag = "xref"
 
-            root = node.getroottree()
-            ref_node = root.findall("//*[@id='%s']" % href)
+            rid = href.replace("#", "")
+            ref_node = self.get_element_by_id(node, rid)
+            ref_type = ref_node is not None and self.ref_types.get(ref_node.tag)
 
-            _attrib.update(
-                {
-                    "rid": href.replace("#", ""),
-                    "ref-type": ref_node and ref_node.tag or "author-notes",
-                }
-            )
+            _attrib.update({"rid": rid, "ref-type": ref_type or "author-notes"})
 
         node.attrib.clear()
         node.attrib.update(_attrib)
@@ -1,9 +1,13 @@
 """ module to utils methods to file """
 
 import os
+import json
+import errno
 import shutil
+import hashlib
 import logging
 
+from lxml import etree
 from documentstore_migracao import config
 
 logger = logging.getLogger(__name__)
@@ -11,24 +15,85 @@ logger = logging.getLogger(__name__)
 
 def setup_processing_folder():
 
-    paths = config.INITIAL_PATH
+    paths = config.initial_path()
     for path in paths:
         if not os.path.exists(path):
             logger.debug("Criando pasta : %s", path)
             os.makedirs(path)
 
 
+def move_file(source, target):
+    """ moves the file with an atomic rename, or with a copy if target is in
+    another filesystem """
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.replace(source, target)
+    except OSError as ex:
+        if ex.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
+
+
 def move_xml_conversion2success(xml_file):
+    """ moves xml_file, relative to CONVERSION_PATH, to SUCCESS_PROCESSING_PATH """
 
-    shutil.move(
+    move_file(
         os.path.join(config.get("CONVERSION_PATH"), xml_file),
         os.path.join(config.get("SUCCESS_PROCESSING_PATH"), xml_file),
     )
 
 
+def move_xml_conversion2quarantine(xml_file):
+    """ moves xml_file, relative to CONVERSION_PATH, to QUARANTINE_PATH """
+
+    move_file(
+        os.path.join(config.get("CONVERSION_PATH"), xml_file),
+        os.path.join(config.get("QUARANTINE_PATH"), xml_file),
+    )
+
+
 def list_dir(path):
 
-    return [f for f in os.listdir(path) if f.endswith(".xml")]
+    return [os.path.basename(f) for f in iter_dir(path)]
+
+
+def iter_dir(path, recursive=False):
+    """ generator of the paths of the XML files of path, read lazily with
+    os.scandir. When recursive, also walks the shards (subdirectories) """
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if recursive:
+                    for sub_path in iter_dir(entry.path, recursive):
+                        yield sub_path
+
+            elif entry.name.endswith(".xml"):
+                yield entry.path
+
+
+def relative_path(path, base):
+    """ path relative to base, keeping its shard, or only its name if it
+    is not inside base """
+
+    if not is_inside(path, base):
+        return os.path.basename(path)
+    return os.path.relpath(path, base)
+
+
+def is_inside(path, base):
+    """ true when path is in base or in one of its subdirectories """
+
+    return not os.path.relpath(path, base).startswith(os.pardir)
+
+
+def shard_path(base, shard, name):
+    """ path of name in the shard directory of base, created if needed """
+
+    path = os.path.join(base, shard)
+    os.makedirs(path, exist_ok=True)
+    return os.path.join(path, name)
 
 
 def read_file(path):
@@ -41,9 +106,52 @@ def read_file(path):
     return text
 
 
+def read_lines(path):
+    """ lines of the text file, without the blank ones and the comments (#) """
+
+    return [
+        line.strip()
+        for line in read_file(path).splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
 def write_file(path, source):
 
     logger.debug("Gravando arquivo: %s", path)
     file = open(path, "w", encoding="utf-8")
     file.write(source)
     file.close()
+
+
+def append_jsonl(file, rows):
+    """ appends the rows as JSON lines to the open file and flushes them, so
+    that they are kept if the run is stopped """
+
+    file.write("".join(json.dumps(row) + "\n" for row in rows))
+    file.flush()
+
+
+def checksum(path):
+    """ sha1 of the bytes of the file """
+
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def read_xml(path):
+    """ parses the file straight from its bytes """
+
+    logger.debug("Lendo arquivo: %s", path)
+    return etree.parse(path).getroot()
+
+
+def write_xml(path, obj_xml):
+    """ serializes the element straight to the file, in UTF-8 """
+
+    logger.debug("Gravando arquivo: %s", path)
+    with etree.xmlfile(path, encoding="utf-8") as xf:
+        xf.write(obj_xml)
@@ -1,19 +1,25 @@
 """ module to utils of logger app """
 import os
+import sys
+import json
+import queue
+import logging
+import threading
+import multiprocessing
+from collections import Counter
 from logging import config as l_config
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from documentstore_migracao import config
 
+FORMAT = "%(asctime)s %(levelname)-5.5s [%(name)s][%(threadName)s] %(message)s"
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
 
 def configure_logger():
     l_config.dictConfig(
         {
             "version": 1,
-            "formatters": {
-                "default": {
-                    "format": "%(asctime)s %(levelname)-5.5s [%(name)s][%(threadName)s] %(message)s",
-                    "datefmt": "%Y-%m-%d %H:%M:%S",
-                }
-            },
+            "formatters": {"default": {"format": FORMAT, "datefmt": DATEFMT}},
             "handlers": {
                 "console": {
                     "level": "DEBUG",
@@ -34,3 +40,165 @@ def configure_logger():
             "disable_existing_loggers": False,
         }
     )
+
+
+class JSONFormatter(logging.Formatter):
+    """ one JSON object by record, with the traceback of the exception """
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record, DATEFMT),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.process,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """ lets through every record of level WARNING or above and one of each
+    `rate` records below it, counted by the line of code that logs them.
+
+    The records logged with extra={"sample": False}, as the progress line of
+    the metrics, are never dropped """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+        self.seen = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate <= 1:
+            return True
+        if not getattr(record, "sample", True):
+            return True
+
+        key = (record.name, record.lineno)
+        with self._lock:
+            self.seen[key] += 1
+            count = self.seen[key]
+        return count % self.rate == 1
+
+    def suppressed(self):
+        """ number of records dropped by line of code """
+
+        if self.rate <= 1:
+            return {}
+        return {
+            key: count - (count + self.rate - 1) // self.rate
+            for key, count in self.seen.items()
+            if count > 1
+        }
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """ sends the records as they are to the queue, so that they are only
+    formatted by the listener thread.
+
+    The processes forked from this one send their records, already
+    formatted, to `process_queue`, so that only the listeners of this
+    process write to the files """
+
+    def __init__(self, log_queue, process_queue):
+        super().__init__(log_queue)
+        self.pid = os.getpid()
+        self.process_queue = process_queue
+
+    def prepare(self, record):
+        if os.getpid() == self.pid:
+            return record
+        return super().prepare(record)
+
+    def enqueue(self, record):
+        if os.getpid() == self.pid:
+            self.queue.put_nowait(record)
+        else:
+            self.process_queue.put_nowait(record)
+
+
+class BulkQueueListener(QueueListener):
+    """ listener of the records of this process and, by a second listener,
+    of the ones of the forked processes. When it is stopped, logs how many
+    records were dropped by the sampling """
+
+    def __init__(self, log_queue, *handlers, sampling=None, process_queue=None):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.sampling = sampling
+        self.process_queue = process_queue
+        self.process_listener = None
+        if process_queue is not None:
+            self.process_listener = QueueListener(
+                process_queue, *handlers, respect_handler_level=True
+            )
+
+    def start(self):
+        super().start()
+        if self.process_listener is not None:
+            self.process_listener.start()
+
+    def stop(self):
+        if self.process_listener is not None:
+            self.process_listener.stop()
+            self.process_queue.close()
+            self.process_queue.join_thread()
+        super().stop()
+        for (name, lineno), count in sorted(self.sampling.suppressed().items()):
+            self.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.INFO,
+                        "levelname": "INFO",
+                        "msg": "%s mensagens de %s:%s omitidas pela amostragem",
+                        "args": (count, name, lineno),
+                    }
+                )
+            )
+
+
+def configure_bulk_logger(sample_rate=None):
+    """ logging for long runs: the records are formatted and written by a
+    background thread, only one of each LOGGER_SAMPLE_RATE records below
+    WARNING of the same line is kept, and the errors go to a JSON lines
+    file large enough for the failures of a whole run.
+
+    Returns the listener, that must be stopped at the end of the run to
+    flush the queue """
+
+    if sample_rate is None:
+        sample_rate = config.get("LOGGER_SAMPLE_RATE")
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(FORMAT, DATEFMT))
+
+    errors = RotatingFileHandler(
+        os.path.join(config.get("LOGGER_PATH"), "migracao.errors.jsonl"),
+        maxBytes=config.get("LOGGER_ERROR_MAX_BYTES"),
+        backupCount=config.get("LOGGER_ERROR_BACKUP_COUNT"),
+        encoding="utf-8",
+    )
+    errors.setLevel(logging.ERROR)
+    errors.setFormatter(JSONFormatter())
+
+    log_queue = queue.Queue()
+    process_queue = multiprocessing.Queue()
+    sampling = SamplingFilter(sample_rate)
+    handler = BackgroundQueueHandler(log_queue, process_queue)
+    handler.addFilter(sampling)
+
+    root = logging.getLogger()
+    for old_handler in list(root.handlers):
+        root.removeHandler(old_handler)
+        old_handler.close()
+    root.addHandler(handler)
+
+    listener = BulkQueueListener(
+        log_queue, console, errors, sampling=sampling, process_queue=process_queue
+    )
+    listener.start()
+    return listener
@@ -0,0 +1,157 @@
+""" module to the manifest of the articles already extracted and converted """
+
+import os
+import sqlite3
+import hashlib
+import logging
+
+from documentstore_migracao.utils import files
+
+logger = logging.getLogger(__name__)
+
+
+def checksum(text):
+
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """ sqlite register of each extracted article with its ArticleMeta
+    processing date, version and the checksum of the saved XML, and of
+    each converted file with the checksum of its source and the version
+    of the converter, and of the stage reached by each article in the
+    pipeline """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                code TEXT PRIMARY KEY,
+                processing_date TEXT,
+                version TEXT,
+                checksum TEXT,
+                path TEXT
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS conversions (
+                name TEXT PRIMARY KEY,
+                source_checksum TEXT,
+                converter_version TEXT
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS pipeline (
+                code TEXT PRIMARY KEY,
+                stage TEXT,
+                path TEXT,
+                error TEXT
+            )"""
+        )
+        self.conn.commit()
+
+    def get(self, code):
+
+        return self.conn.execute(
+            "SELECT * FROM articles WHERE code = ?", (code,)
+        ).fetchone()
+
+    def get_version(self, code):
+        """ version of the article already known by the manifest, or None """
+
+        row = self.conn.execute(
+            "SELECT version FROM articles WHERE code = ?", (code,)
+        ).fetchone()
+        return row and row["version"]
+
+    def update(self, code, processing_date, version, checksum=None, path=None):
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?)",
+            (code, processing_date, version, checksum, path),
+        )
+        self.conn.commit()
+
+    def is_unchanged(self, identifier):
+        """ true when the article of the ArticleMeta identifier was extracted
+        with the same processing date and its file is intact """
+
+        processing_date = identifier.get("processing_date")
+        row = self.get(identifier["code"])
+        if not processing_date or row is None:
+            return False
+
+        if row["processing_date"] != processing_date:
+            return False
+
+        if row["version"] == "xml":
+            return True
+
+        if not row["path"] or not os.path.isfile(row["path"]):
+            return False
+
+        return checksum(files.read_file(row["path"])) == row["checksum"]
+
+    def is_converted(self, name, source_checksum, converter_version):
+        """ true when the file was converted from the same source by the same
+        version of the converter """
+
+        row = self.conn.execute(
+            "SELECT * FROM conversions WHERE name = ?", (name,)
+        ).fetchone()
+        return (
+            row is not None
+            and row["source_checksum"] == source_checksum
+            and row["converter_version"] == converter_version
+        )
+
+    def update_conversion(self, name, source_checksum, converter_version):
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO conversions VALUES (?, ?, ?)",
+            (name, source_checksum, converter_version),
+        )
+        self.conn.commit()
+
+    def get_stage(self, code):
+        """ stage of the article in the pipeline, or None """
+
+        row = self.conn.execute(
+            "SELECT stage FROM pipeline WHERE code = ?", (code,)
+        ).fetchone()
+        return row and row["stage"]
+
+    def set_stage(self, code, stage, path=None, error=None):
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pipeline VALUES (?, ?, ?, ?)",
+            (code, stage, path, error),
+        )
+        self.conn.commit()
+
+    def list_stage(self, stage):
+        """ rows of the articles that stopped at the stage of the pipeline """
+
+        return self.conn.execute(
+            "SELECT * FROM pipeline WHERE stage = ?", (stage,)
+        ).fetchall()
+
+    def list_unfinished(self, stages):
+        """ code and path of the extracted articles that did not reach any of
+        the stages of the pipeline, including the ones extracted out of it """
+
+        marks = ", ".join("?" * len(stages))
+        return self.conn.execute(
+            """SELECT code, path FROM pipeline
+                WHERE stage NOT IN (%s) AND path IS NOT NULL
+            UNION
+            SELECT code, path FROM articles
+                WHERE path IS NOT NULL AND code NOT IN (SELECT code FROM pipeline)"""
+            % marks,
+            tuple(stages),
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
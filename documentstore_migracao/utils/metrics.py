@@ -0,0 +1,212 @@
+""" module to the counters and timings of the migration """
+
+import os
+import json
+import time
+import bisect
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# a linha de progresso tem o seu nível, ela aparece com o --loglevel padrão
+# (WARNING) sem trazer as mensagens de cada arquivo
+progress_logger = logging.getLogger(__name__ + ".progress")
+progress_logger.setLevel(logging.INFO)
+
+# limites, em segundos, das faixas dos histogramas
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+PROMETHEUS_PREFIX = "documentstore_migracao_"
+
+
+class Histogram:
+    """ count, sum, min, max and the counts by bucket of the observed values """
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.buckets[bisect.bisect_left(BUCKETS, value)] += 1
+
+    def merge(self, data):
+        if not data["count"]:
+            return
+
+        self.count += data["count"]
+        self.sum += data["sum"]
+        self.min = data["min"] if self.min is None else min(self.min, data["min"])
+        self.max = data["max"] if self.max is None else max(self.max, data["max"])
+        for i, count in enumerate(data["buckets"]):
+            self.buckets[i] += count
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": list(self.buckets),
+        }
+
+
+class Metrics:
+    """ thread safe counters and histograms of the run. The snapshot of the
+    metrics of a process can be merged into the ones of another, so the
+    workers of a pool send back what they measured """
+
+    def __init__(self):
+        self.started = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram()
+            self.histograms[name].observe(value)
+
+    @contextmanager
+    def timer(self, name):
+        """ observes in the histogram the seconds spent in the block """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "elapsed": time.time() - self.started,
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: histogram.as_dict()
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+    def merge(self, snapshot):
+        with self._lock:
+            for name, value in snapshot["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, data in snapshot["histograms"].items():
+                if name not in self.histograms:
+                    self.histograms[name] = Histogram()
+                self.histograms[name].merge(data)
+
+    def progress_line(self):
+        """ counters with their rate per second since the start """
+
+        snapshot = self.snapshot()
+        elapsed = max(snapshot["elapsed"], 1e-9)
+        counters = ", ".join(
+            "%s=%s (%.1f/s)" % (name, value, value / elapsed)
+            for name, value in sorted(snapshot["counters"].items())
+        )
+        return "Progresso em %.0fs: %s" % (snapshot["elapsed"], counters or "-")
+
+    def to_prometheus(self):
+        """ metrics in the Prometheus text format, for the textfile collector """
+
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = PROMETHEUS_PREFIX + name + "_total"
+            lines.append("# TYPE %s counter" % metric)
+            lines.append("%s %s" % (metric, value))
+
+        for name, data in sorted(snapshot["histograms"].items()):
+            metric = PROMETHEUS_PREFIX + name
+            lines.append("# TYPE %s histogram" % metric)
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), data["buckets"]):
+                cumulative += count
+                lines.append('%s_bucket{le="%s"} %s' % (metric, bound, cumulative))
+            lines.append("%s_sum %s" % (metric, data["sum"]))
+            lines.append("%s_count %s" % (metric, data["count"]))
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """ writes the metrics at once to path, in the Prometheus text format
+        if it ends with .prom or as JSON otherwise """
+
+        if path.endswith(".prom"):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.snapshot(), indent=2)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+METRICS = Metrics()
+
+
+class MeasuredTask:
+    """ wrapper of the task of a stage that returns its result with the
+    snapshot of the metrics of the call: the seconds spent, the document and
+    its bytes. func must be a module level function, so that it is pickled
+    to the processes of a pool """
+
+    def __init__(self, func, stage):
+        self.func = func
+        self.stage = stage
+
+    def __call__(self, file_path):
+        task_metrics = Metrics()
+        task_metrics.inc(self.stage + "_documents")
+        try:
+            task_metrics.inc(self.stage + "_bytes", os.path.getsize(file_path))
+        except OSError:
+            pass
+
+        with task_metrics.timer(self.stage + "_seconds"):
+            result = self.func(file_path)
+        return result, task_metrics.snapshot()
+
+
+@contextmanager
+def report_progress(interval, obj_metrics=METRICS):
+    """ logs the progress line every `interval` seconds while the block
+    runs, interval 0 disables it """
+
+    if not interval:
+        yield
+        return
+
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            progress_logger.info(obj_metrics.progress_line(), extra={"sample": False})
+
+    thread = threading.Thread(target=run, name="metrics", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        progress_logger.info(obj_metrics.progress_line(), extra={"sample": False})
@@ -0,0 +1,120 @@
+""" module to utils methods to run tasks in parallel """
+
+import itertools
+import collections
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+    FIRST_COMPLETED,
+)
+
+from documentstore_migracao import config
+
+
+def chunks(items, size):
+    """ generator of lists with up to `size` items """
+
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def round_robin(iterables, active):
+    """ generator of the items of the iterables taken in turns.
+
+    Only `active` iterables are consumed at a time, the next one is started
+    when one of them is exhausted, so that `iterables` may be lazy """
+
+    iterables = iter(iterables)
+    queue = collections.deque()
+
+    def start():
+        for iterable in itertools.islice(iterables, active - len(queue)):
+            queue.append(iter(iterable))
+
+    start()
+    while queue:
+        iterator = queue.popleft()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            start()
+            continue
+        queue.append(iterator)
+        yield item
+
+
+def imap_unordered(executor, func, items, max_pending):
+    """ generator of (item, func(item)) in the order they are completed.
+
+    Only `max_pending` tasks are submitted to the executor at a time, so
+    neither `items` nor the results are fully held in memory """
+
+    items = iter(items)
+    pending = {}
+
+    def submit(count):
+        for item in itertools.islice(items, count):
+            pending[executor.submit(func, item)] = item
+
+    submit(max_pending)
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                result = future.result()
+                submit(1)
+                yield item, result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def executor(workers):
+    """ pool of `workers` processes, or of a single thread if workers is 1,
+    that still runs the tasks alongside the caller """
+
+    if workers <= 1:
+        return ThreadPoolExecutor(max_workers=1)
+    return process_executor(workers)
+
+
+def process_executor(workers):
+    """ pool of `workers` processes that use the settings of this one """
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=config.set_settings,
+        initargs=(config.settings(),),
+    )
+
+
+def _call_chunk(func_chunk):
+    func, chunk = func_chunk
+    return [func(item) for item in chunk]
+
+
+def imap_chunks(func, items, workers, chunksize):
+    """ generator of (item, func(item)) with the items sent in chunks to a
+    pool of `workers` processes, or run in this process if workers is 1.
+
+    func must be a module level function, so that it can be pickled """
+
+    if workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    func_chunks = ((func, chunk) for chunk in chunks(items, chunksize))
+    max_pending = workers * config.get("PENDING_PER_WORKER")
+    with process_executor(workers) as executor:
+        for (_, chunk), results in imap_unordered(
+            executor, _call_chunk, func_chunks, max_pending=max_pending
+        ):
+            for item, result in zip(chunk, results):
+                yield item, result
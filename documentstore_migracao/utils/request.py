@@ -1,8 +1,324 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from urllib.parse import urlparse, urlencode
+
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from documentstore_migracao import config
+from documentstore_migracao.utils import metrics
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_hosts_semaphore = {}
+_hosts_lock = threading.Lock()
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+class RateLimiter:
+    """ spaces the calls to wait() so that at most `rate` calls per second
+    go through, rate 0 disables the limit """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+# fração de max_size a que o cache é reduzido quando passa do limite, para
+# que a varredura das entradas não se repita a cada resposta gravada
+CACHE_LOW_WATER = 0.9
+
+
+class ResponseCache:
+    """ on-disk cache of the responses of GET requests keyed by the url and
+    the params. Entries younger than `ttl` seconds are used without any
+    request, older ones are revalidated with their ETag or Last-Modified,
+    and the least recently used ones are removed when the cache grows over
+    `max_size` bytes, down to CACHE_LOW_WATER of it """
+
+    def __init__(self, path, ttl, max_size):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._size = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(uri, params=None):
+        if params:
+            uri += "?" + urlencode(sorted(params.items()), doseq=True)
+        return hashlib.sha1(uri.encode("utf-8")).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def load(self, key):
+        """ metadata and content of the cached response, or None """
+
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline().decode("utf-8"))
+                content = f.read()
+            # o mtime marca o ultimo uso para a remocao dos menos usados
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return meta, content
+
+    def is_fresh(self, meta):
+        return time.time() - meta["stored_at"] < self.ttl
+
+    @staticmethod
+    def validators(meta):
+        """ conditional headers to revalidate the cached response """
+
+        cached_headers = CaseInsensitiveDict(meta["headers"])
+        headers = {}
+        if cached_headers.get("ETag"):
+            headers["If-None-Match"] = cached_headers["ETag"]
+        if cached_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+        return headers
+
+    def store(self, key, response):
+
+        meta = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+        }
+        self.save(key, meta, response.content)
+
+    def save(self, key, meta, content):
+        """ writes the entry at once and evicts the least recently used ones
+        if the cache gets too big """
+
+        meta = dict(meta, stored_at=time.time())
+        path = self.entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8") + b"\n")
+            f.write(content)
+            size = f.tell()
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry[1] for entry in self._entries())
+            try:
+                self._size -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(tmp_path, path)
+            self._size += size
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self):
+        """ (mtime, size, path) of each entry of the cache """
+
+        for shard in os.scandir(self.path):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    yield stat.st_mtime, stat.st_size, entry.path
+
+    def _evict(self):
+
+        low_water = self.max_size * CACHE_LOW_WATER
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= low_water:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+
+
+def cached_response(meta, content):
+    """ requests.Response rebuilt from the cached entry """
+
+    response = requests.Response()
+    response.url = meta["url"]
+    response.status_code = meta["status_code"]
+    response.headers = CaseInsensitiveDict(meta["headers"])
+    response.encoding = meta["encoding"]
+    response._content = content
+    response.from_cache = True
+    return response
+
+
+def get_cache():
+    """ response cache of REQUEST_CACHE_PATH, or None if it is disabled """
+
+    path = config.get("REQUEST_CACHE_PATH")
+    if not path:
+        return None
+
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResponseCache(
+                path,
+                config.get("REQUEST_CACHE_TTL"),
+                config.get("REQUEST_CACHE_MAX_SIZE"),
+            )
+        return _caches[path]
+
+
+def _host_semaphore(uri):
+    """ semaphore that bounds the simultaneous requests to the host of uri """
+
+    host = urlparse(uri).netloc
+    with _hosts_lock:
+        if host not in _hosts_semaphore:
+            _hosts_semaphore[host] = threading.BoundedSemaphore(
+                config.get("REQUEST_MAX_PER_HOST")
+            )
+        return _hosts_semaphore[host]
+
+
+def create_session():
+
+    retry = Retry(
+        total=config.get("REQUEST_RETRIES"),
+        backoff_factor=config.get("REQUEST_BACKOFF_FACTOR"),
+        status_forcelist=RETRY_STATUS,
+        raise_on_status=False,
+    )
+    pool_size = config.get("REQUEST_POOL_SIZE")
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.rate_limiter = RateLimiter(config.get("REQUEST_RATE_LIMIT"))
+    return session
+
+
+def get_session():
+    """ keep-alive session shared by the threads of the process """
+
+    global _session, _session_pid
+
+    with _session_lock:
+        # conexoes abertas nao podem ser compartilhadas com processos filhos
+        if _session is None or _session_pid != os.getpid():
+            _session = create_session()
+            _session_pid = os.getpid()
+        return _session
 
 
 def get(uri, **kwargs):
 
-    r = requests.get(uri, **kwargs)
-    r.raise_for_status()
+    cache = get_cache()
+    cached = None
+    if cache is not None:
+        key = cache.key(uri, kwargs.get("params"))
+        cached = cache.load(key)
+        if cached is not None:
+            meta, content = cached
+            if cache.is_fresh(meta):
+                metrics.METRICS.inc("http_cache_hits")
+                return cached_response(meta, content)
+            kwargs["headers"] = dict(
+                kwargs.get("headers") or {}, **cache.validators(meta)
+            )
+
+    kwargs.setdefault("timeout", config.get("REQUEST_TIMEOUT"))
+    session = get_session()
+    metrics.METRICS.inc("http_requests")
+    try:
+        with _host_semaphore(uri), metrics.METRICS.timer("http_request_seconds"):
+            session.rate_limiter.wait()
+            r = session.get(uri, **kwargs)
+    except requests.RequestException:
+        metrics.METRICS.inc("http_errors")
+        raise
+
+    retries = getattr(r.raw, "retries", None)
+    if retries is not None and retries.history:
+        metrics.METRICS.inc("http_retries", len(retries.history))
+
+    if cached is not None and r.status_code == 304:
+        # revalidada, a resposta guardada vale por mais um ttl
+        metrics.METRICS.inc("http_not_modified")
+        cache.save(key, meta, content)
+        return cached_response(meta, content)
+
+    try:
+        r.raise_for_status()
+    except requests.HTTPError:
+        metrics.METRICS.inc("http_errors")
+        raise
+
+    metrics.METRICS.inc("http_bytes", len(r.content))
+    if cache is not None and r.status_code == 200:
+        cache.store(key, r)
     return r
+
+
+def is_last_page(page, offset, page_size):
+    """ true when the listing ends with the page, whose objects end at
+    offset. ArticleMeta caps the limit, so a page shorter than page_size only
+    ends the listing when the meta has no total """
+
+    objects = page.get("objects", [])
+    if not objects:
+        return True
+
+    total = page.get("meta", {}).get("total")
+    if total is not None:
+        return offset >= total
+    return len(objects) < page_size
+
+
+def iter_pages(fetch_page, page_size):
+    """ generator of the "objects" of a paginated ArticleMeta listing,
+    fetch_page(offset, limit) returns the page starting at offset """
+
+    offset = 0
+    while True:
+        page = fetch_page(offset, page_size)
+        objects = page.get("objects", [])
+        for obj in objects:
+            yield obj
+
+        offset += len(objects)
+        if is_last_page(page, offset, page_size):
+            break
@@ -2,40 +2,112 @@
 
 import re
 import logging
-import unicodedata
+import threading
+from collections import Counter
 
 from lxml import etree
 from documentstore_migracao.utils.convert_html_body import Convert2SPSBody
 
 logger = logging.getLogger(__name__)
 
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+
+# quantidade de corpos interpretados por cada parser: xml, html ou empty
+PARSE_STATS = Counter()
+
+_local = threading.local()
+
+
+def _parsers():
+    """ parsers reused by the thread, the feed interface keeps state between
+    calls so they can not be shared among threads """
+
+    if not hasattr(_local, "xml_parser"):
+        _local.xml_parser = etree.XMLParser()
+        _local.html_parser = etree.HTMLParser(recover=True)
+    return _local.xml_parser, _local.html_parser
+
+
+def _feed(parser, string):
+    parser.feed("<div>")
+    if string:
+        parser.feed(string)
+    parser.feed("</div>")
+    return parser.close()
+
+
+def _html_content(root):
+    """ div with the text and all the children of the parsed html/body. A
+    stray closing tag in the string ends the div fed around it, so its
+    content is merged with the one that follows it in the body """
+
+    body = root.find("body")
+    if body is None or not len(body):
+        return None
+
+    wrapper = body[0]
+    content = etree.Element("div")
+    content.text = wrapper.text
+    content.extend(wrapper)
+    last = content[-1] if len(content) else None
+
+    if wrapper.tail:
+        if last is not None:
+            last.tail = (last.tail or "") + wrapper.tail
+        else:
+            content.text = (content.text or "") + wrapper.tail
+    content.extend(body[1:])
+    return content
+
 
 def str2objXML(string):
-    _string = unicodedata.normalize("NFKD", " ".join(string.split()))
+    """ parses the legacy HTML body into a div: first as XML, then with the
+    recovering HTML parser, and at last returns an empty div """
+
+    xml_parser, html_parser = _parsers()
+    obj_xml = etree.Element("div", nsmap={"xlink": XLINK_NAMESPACE})
+
     try:
-        return etree.fromstring("<div>%s</div>" % (string))
+        parsed = _feed(xml_parser, string)
+        PARSE_STATS["xml"] += 1
     except etree.XMLSyntaxError as e:
-        logger.exception(e)
-        return etree.fromstring("<div></div>")
+        logger.debug("Corpo nao e XML valido (%s), usando parser HTML", e)
+        try:
+            parsed = _html_content(_feed(html_parser, string))
+        except etree.LxmlError:
+            parsed = None
+
+        if parsed is None:
+            logger.warning("Corpo nao pode ser recuperado, usando div vazio")
+            PARSE_STATS["empty"] += 1
+            return obj_xml
+        PARSE_STATS["html"] += 1
+
+    obj_xml.text = parsed.text
+    obj_xml.extend(parsed)
+    return obj_xml
 
 
 def find_medias(obj_xml):
+    """ images and files referenced by the body, as dicts with kind ("img"
+    or "file") and path """
 
     html = obj_xml.find("body")
     media = []
     # IMG
-    imgs = html.findall(".//graphic")
+    imgs = html.iterfind(".//graphic")
     for img in imgs:
-        logger.info("\t IMG %s", img.attrib["src"])
-        media.append(img.attrib["src"])
+        src = img.get("{%s}href" % XLINK_NAMESPACE) or img.get("src")
+        logger.info("\t IMG %s", src)
+        media.append({"kind": "img", "path": src})
 
     # FILES
-    tags_a = html.findall("a[@href]")
+    tags_a = html.iterfind(".//a[@href]")
     for a in tags_a:
         href = a.attrib["href"]
         if href.startswith("/img/"):
-            logger.info("\t FILE %s", a.attrib)
-            media.append(href)
+            logger.info("\t FILE %s", href)
+            media.append({"kind": "file", "path": href})
 
     return media
 
@@ -20,11 +20,19 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     license="2-clause BSD",
     packages=setuptools.find_packages(
-        exclude=["*.tests", "*.tests.*", "tests.*", "tests"]
+        exclude=[
+            "*.tests",
+            "*.tests.*",
+            "tests.*",
+            "tests",
+            "benchmarks",
+            "benchmarks.*",
+        ]
     ),
     include_package_data=False,
     python_requires=">=3.6",
     install_requires=install_requires,
+    extras_require={"async": ["aiohttp"]},
     test_suite="tests",
     classifiers=(
         "Development Status :: 2 - Pre-Alpha",
@@ -0,0 +1,67 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from documentstore_migracao import config
+
+from . import utils
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.config_path = os.path.join(self.tmpdir.name, "migracao.ini")
+        with open(self.config_path, "w") as f:
+            f.write(
+                "[documentstore_migracao]\n"
+                "processpool_max_workers = 4\n"
+                "REQUEST_TIMEOUT = 5\n"
+            )
+
+    def test_load_defaults(self):
+        settings = config.load(environ={})
+
+        self.assertEqual(settings, config.Settings())
+        self.assertEqual(settings.PROCESSPOOL_MAX_WORKERS, 1)
+
+    def test_load_environ(self):
+        settings = config.load(
+            environ={"REQUEST_TIMEOUT": "2.5", "LOGGER_BULK": "true", "OTHER": "x"}
+        )
+
+        self.assertEqual(settings.REQUEST_TIMEOUT, 2.5)
+        self.assertIs(settings.LOGGER_BULK, True)
+
+    def test_load_config_file(self):
+        settings = config.load(self.config_path, environ={"REQUEST_TIMEOUT": "8"})
+
+        self.assertEqual(settings.PROCESSPOOL_MAX_WORKERS, 4)
+        self.assertEqual(settings.REQUEST_TIMEOUT, 8)
+
+    def test_load_config_file_unknown_setting(self):
+        with open(self.config_path, "a") as f:
+            f.write("PROCESSPOOL_WORKERS = 4\n")
+
+        self.assertRaises(ValueError, config.load, self.config_path, {})
+
+    def test_load_invalid_value(self):
+        self.assertRaises(
+            ValueError, config.load, environ={"PROCESSPOOL_MAX_WORKERS": "many"}
+        )
+
+    def test_settings_cached(self):
+        with utils.environ(PROCESSPOOL_MAX_WORKERS="3"):
+            self.assertIs(config.settings(), config.settings())
+            self.assertEqual(config.get("PROCESSPOOL_MAX_WORKERS"), 3)
+
+        self.assertEqual(config.get("PROCESSPOOL_MAX_WORKERS"), 1)
+
+    def test_get_unknown(self):
+        self.assertEqual(config.get("UNKNOWN"), "")
+        self.assertEqual(config.get("count"), "")
+
+    def test_settings_pickle(self):
+        settings = config.settings()
+        self.assertEqual(pickle.loads(pickle.dumps(settings)), settings)
@@ -1,8 +1,9 @@
+import asyncio
 import unittest
-from unittest.mock import patch, ANY
+from unittest.mock import patch, ANY, AsyncMock
 from xylose.scielodocument import Journal
-from documentstore_migracao.export import journal, article
-from . import SAMPLES_JOURNAL
+from documentstore_migracao.export import journal, article, aio
+from . import utils, SAMPLES_JOURNAL
 
 
 @patch("documentstore_migracao.export.journal.request.get")
@@ -28,14 +29,44 @@ class TestExportJournal(unittest.TestCase):
     def test_get_all_journal(self, mk_ext_journal, mk_ext_identifiers, mk_r):
 
         obj_journal = Journal(SAMPLES_JOURNAL)
-        mk_ext_identifiers.return_value = {
-            "objects": ["ANY", "ANY", {"code": "36341997000100001"}]
-        }
+        mk_ext_identifiers.return_value = {"objects": [{"code": "0036-3634"}]}
         mk_ext_journal.return_value = obj_journal
 
         result = journal.get_all_journal()
         self.assertEqual(result[0], obj_journal)
 
+    @patch("documentstore_migracao.export.journal.ext_identifiers")
+    @patch("documentstore_migracao.export.journal.ext_journal")
+    def test_iter_all_journal_is_lazy(self, mk_ext_journal, mk_ext_identifiers, mk_r):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [{"code": "0036-3634"}, {"code": "1234-5678"}]
+        }
+
+        result = journal.iter_all_journal()
+        mk_ext_journal.assert_not_called()
+
+        next(result)
+        mk_ext_journal.assert_called_once_with("0036-3634")
+
+    @patch("documentstore_migracao.export.journal.ext_identifiers")
+    @patch("documentstore_migracao.export.journal.ext_journal")
+    def test_iter_all_journal_with_issns(
+        self, mk_ext_journal, mk_ext_identifiers, mk_r
+    ):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [{"code": "0036-3634"}, {"code": "1234-5678"}]
+        }
+
+        list(journal.iter_all_journal(exclude_issns=["0036-3634"]))
+        mk_ext_journal.assert_called_once_with("1234-5678")
+
+        mk_ext_journal.reset_mock()
+        list(journal.iter_all_journal(["0001-3765", "1234-5678"], ["1234-5678"]))
+        mk_ext_journal.assert_called_once_with("0001-3765")
+        mk_ext_identifiers.assert_called_once_with(offset=0, limit=ANY)
+
 
 class TestExportArticle(unittest.TestCase):
     @patch("documentstore_migracao.export.article.request.get")
@@ -46,6 +77,28 @@ class TestExportArticle(unittest.TestCase):
             ANY, params={"collection": ANY, "issn": "1234-5678"}
         )
 
+    @patch("documentstore_migracao.export.article.ext_identifiers")
+    def test_iter_identifiers(self, mk_ext_identifiers):
+
+        mk_ext_identifiers.side_effect = [
+            {"meta": {"total": 3}, "objects": [{"code": "1"}, {"code": "2"}]},
+            {"meta": {"total": 3}, "objects": [{"code": "3"}]},
+        ]
+        with utils.environ(AM_PAGE_SIZE="2"):
+            result = list(
+                article.iter_identifiers(
+                    "1234-5678", from_date="2018-01-01", until_date="2018-12-31"
+                )
+            )
+
+        self.assertEqual([d["code"] for d in result], ["1", "2", "3"])
+        mk_ext_identifiers.assert_called_with(
+            "1234-5678",
+            offset=2,
+            limit=2,
+            **{"from": "2018-01-01", "until": "2018-12-31"}
+        )
+
     @patch("documentstore_migracao.export.article.request.get")
     def test_ext_article(self, mk_request_get):
 
@@ -68,10 +121,15 @@ class TestExportArticle(unittest.TestCase):
             "S0036-36341997000100001", body="true", format="xmlrsps"
         )
 
+    @patch("documentstore_migracao.export.article.ext_article_txt")
+    @patch("documentstore_migracao.export.article.ext_article_json")
     @patch("documentstore_migracao.export.article.ext_identifiers")
-    def test_get_all_articles_notXML(self, mk_ext_identifiers):
+    def test_get_all_articles_notXML(
+        self, mk_ext_identifiers, mk_ext_article_json, mk_ext_article_txt
+    ):
 
         obj_journal = Journal(SAMPLES_JOURNAL)
+        mk_ext_article_json.return_value = {"version": "html"}
         mk_ext_identifiers.return_value = {
             "objects": [
                 {"code": "S0036-36341997000100001"},
@@ -79,4 +137,217 @@ class TestExportArticle(unittest.TestCase):
             ]
         }
         result = article.get_all_articles_notXML("0036-3634")
-        self.assertEqual(result[0][0], "S0036-36341997000100001")
+        self.assertIn("S0036-36341997000100001", [code for code, _ in result])
+
+    @patch("documentstore_migracao.export.article.ext_article_txt")
+    @patch("documentstore_migracao.export.article.ext_article_json")
+    def test_ext_article_with_version(self, mk_ext_article_json, mk_ext_article_txt):
+
+        mk_ext_article_json.return_value = {"version": "xml"}
+        self.assertEqual(
+            article.ext_article_with_version("S0036-36341997000100001"), ("xml", None)
+        )
+        mk_ext_article_txt.assert_not_called()
+
+    @patch("documentstore_migracao.export.article.ext_article_txt")
+    @patch("documentstore_migracao.export.article.ext_article_json")
+    @patch("documentstore_migracao.export.article.ext_identifiers")
+    def test_iter_articles_with_skip(
+        self, mk_ext_identifiers, mk_ext_article_json, mk_ext_article_txt
+    ):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [
+                {"code": "S0036-36341997000100001"},
+                {"code": "S0036-36341997000100002"},
+            ]
+        }
+        mk_ext_article_json.return_value = {"version": "html"}
+        mk_ext_article_txt.return_value = "<article/>"
+
+        result = list(
+            article.iter_articles("0036-3634", skip=lambda d: d["code"].endswith("1"))
+        )
+        self.assertEqual(
+            result, [({"code": "S0036-36341997000100002"}, "html", "<article/>")]
+        )
+        mk_ext_article_json.assert_called_once_with("S0036-36341997000100002")
+
+    @patch("documentstore_migracao.export.article.ext_article_txt")
+    @patch("documentstore_migracao.export.article.ext_article_json")
+    @patch("documentstore_migracao.export.article.ext_identifiers")
+    def test_iter_articles_with_known_versions(
+        self, mk_ext_identifiers, mk_ext_article_json, mk_ext_article_txt
+    ):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [
+                {"code": "S0036-36341997000100001"},
+                {"code": "S0036-36341997000100002"},
+            ]
+        }
+        mk_ext_article_txt.return_value = "<article/>"
+        known = {"S0036-36341997000100001": "html", "S0036-36341997000100002": "xml"}
+
+        result = list(article.iter_articles("0036-3634", versions=known.get))
+        self.assertEqual(len(result), 2)
+        mk_ext_article_json.assert_not_called()
+        mk_ext_article_txt.assert_called_once_with("S0036-36341997000100001")
+
+    @patch("documentstore_migracao.export.article.ext_article_with_version")
+    @patch("documentstore_migracao.export.article.ext_identifiers")
+    def test_iter_journals_articles_takes_turns(
+        self, mk_ext_identifiers, mk_ext_article_with_version
+    ):
+
+        mk_ext_identifiers.side_effect = lambda issn, **params: {
+            "objects": [{"code": "%s-%s" % (issn, i)} for i in range(4)]
+            if issn == "0036-3634"
+            else [{"code": "%s-0" % issn}]
+        }
+        mk_ext_article_with_version.return_value = ("html", "<article/>")
+
+        result = list(
+            article.iter_journals_articles(
+                iter(["0036-3634", "1234-5678", "0001-3765"]),
+                max_workers=1,
+                max_journals=2,
+            )
+        )
+        # uma unica thread baixa os artigos na ordem em que foram pedidos
+        self.assertEqual(
+            [code for (code, _), _ in mk_ext_article_with_version.call_args_list],
+            [
+                "0036-3634-0",
+                "1234-5678-0",
+                "0036-3634-1",
+                "0036-3634-2",
+                "0001-3765-0",
+                "0036-3634-3",
+            ],
+        )
+        self.assertIn(
+            ("1234-5678", {"code": "1234-5678-0"}, "html", "<article/>"), result
+        )
+
+    @patch("documentstore_migracao.export.article.ext_article_txt")
+    @patch("documentstore_migracao.export.article.ext_article_json")
+    @patch("documentstore_migracao.export.article.ext_identifiers")
+    def test_iter_articles_notXML(
+        self, mk_ext_identifiers, mk_ext_article_json, mk_ext_article_txt
+    ):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [
+                {"code": "S0036-36341997000100001"},
+                {"code": "S0036-36341997000100002"},
+                {"code": "S0036-36341997000100003"},
+            ]
+        }
+        mk_ext_article_json.side_effect = lambda code: {
+            "version": "xml" if code.endswith("2") else "html"
+        }
+        mk_ext_article_txt.side_effect = lambda code: "<article>%s</article>" % code
+
+        result = dict(article.iter_articles_notXML("0036-3634", max_workers=2))
+        self.assertEqual(
+            result,
+            {
+                "S0036-36341997000100001": "<article>S0036-36341997000100001</article>",
+                "S0036-36341997000100003": "<article>S0036-36341997000100003</article>",
+            },
+        )
+
+
+class TestExportAio(unittest.TestCase):
+    def setUp(self):
+        self.client = aio.ArticleMetaClient(max_requests=10, max_per_host=2)
+
+    def test_ext_article_with_version(self):
+
+        self.client.get = AsyncMock(side_effect=['{"version": "html"}', "<article/>"])
+
+        result = asyncio.run(self.client.ext_article_with_version("S0036-3634"))
+
+        self.assertEqual(result, ("html", "<article/>"))
+        self.client.get.assert_called_with(
+            ANY,
+            params={
+                "collection": ANY,
+                "code": "S0036-3634",
+                "body": "true",
+                "format": "xmlrsps",
+            },
+        )
+
+    def test_ext_article_with_known_version(self):
+
+        self.client.get = AsyncMock()
+
+        result = asyncio.run(self.client.ext_article_with_version("S0036-3634", "xml"))
+
+        self.assertEqual(result, ("xml", None))
+        self.client.get.assert_not_called()
+
+    def test_iter_article_identifiers(self):
+
+        pages = [
+            {"meta": {"total": 3}, "objects": [{"code": "1"}, {"code": "2"}]},
+            {"meta": {"total": 3}, "objects": [{"code": "3"}]},
+        ]
+        self.client.get_json = AsyncMock(side_effect=pages)
+
+        async def codes():
+            return [
+                d_article["code"]
+                async for d_article in self.client.iter_article_identifiers(
+                    "1234-5678", from_date="2018-01-01"
+                )
+            ]
+
+        with utils.environ(AM_PAGE_SIZE="2"):
+            result = asyncio.run(codes())
+
+        self.assertEqual(result, ["1", "2", "3"])
+        self.client.get_json.assert_called_with(
+            ANY,
+            params={
+                "collection": ANY,
+                "issn": "1234-5678",
+                "offset": 2,
+                "limit": 2,
+                "from": "2018-01-01",
+            },
+        )
+
+    def test_iter_article_identifiers_with_capped_limit(self):
+
+        pages = [
+            {"meta": {"total": 3}, "objects": [{"code": "1"}, {"code": "2"}]},
+            {"meta": {"total": 3}, "objects": [{"code": "3"}]},
+        ]
+        self.client.get_json = AsyncMock(side_effect=pages)
+
+        async def codes():
+            return [
+                d_article["code"]
+                async for d_article in self.client.iter_article_identifiers("1234-5678")
+            ]
+
+        with utils.environ(AM_PAGE_SIZE="5000"):
+            result = asyncio.run(codes())
+
+        self.assertEqual(result, ["1", "2", "3"])
+
+    def test_get_retries(self):
+
+        self.client.get_once = AsyncMock(side_effect=[None, "{}"])
+
+        with utils.environ(REQUEST_BACKOFF_FACTOR="0"):
+            result = asyncio.run(self.client.get("http://api.test.com", {"limit": 10}))
+
+        self.assertEqual(result, "{}")
+        self.assertEqual(self.client.get_once.call_count, 2)
+        self.client.get_once.assert_called_with(
+            "http://api.test.com", {"limit": "10"}, aio.RETRY_STATUS
+        )
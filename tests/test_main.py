@@ -1,6 +1,11 @@
+import os
+import json
+import logging
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from documentstore_migracao import main as main_module
 from documentstore_migracao.main import process, main
 
 
@@ -9,19 +14,155 @@ class TestMainProcess(unittest.TestCase):
     def test_arg_extrateFiles(self, mk_extrated_all_data):
 
         process(["--extrateFiles"])
-        mk_extrated_all_data.assert_called_once_with()
+        mk_extrated_all_data.assert_called_once_with(
+            max_workers=None,
+            from_date=None,
+            until_date=None,
+            issns=None,
+            exclude_issns=None,
+            max_journals=None,
+        )
+
+    @patch("documentstore_migracao.processing.extrated.extrated_all_data")
+    def test_arg_extrateFiles_with_workers(self, mk_extrated_all_data):
+
+        process(["--extrateFiles", "--workers", "4"])
+        mk_extrated_all_data.assert_called_once_with(
+            max_workers=4,
+            from_date=None,
+            until_date=None,
+            issns=None,
+            exclude_issns=None,
+            max_journals=None,
+        )
+
+    @patch("documentstore_migracao.processing.extrated.extrated_all_data_async")
+    def test_arg_extrateFiles_async(self, mk_extrated_all_data_async):
+
+        process(["--extrateFiles", "--async", "--workers", "500"])
+        mk_extrated_all_data_async.assert_called_once_with(
+            max_requests=500,
+            from_date=None,
+            until_date=None,
+            issns=None,
+            exclude_issns=None,
+        )
+
+    @patch("documentstore_migracao.processing.extrated.extrated_all_data")
+    def test_arg_extrateFiles_with_dates(self, mk_extrated_all_data):
+
+        process(
+            [
+                "--extrateFiles",
+                "--from-date",
+                "2018-01-01",
+                "--until-date",
+                "2018-12-31",
+            ]
+        )
+        mk_extrated_all_data.assert_called_once_with(
+            max_workers=None,
+            from_date="2018-01-01",
+            until_date="2018-12-31",
+            issns=None,
+            exclude_issns=None,
+            max_journals=None,
+        )
 
     @patch("documentstore_migracao.processing.extrated.extrated_selected_journal")
     def test_arg_issn_journal(self, mk_extrated_selected_journal):
 
         process(["--issn-journal", "1234-5678"])
-        mk_extrated_selected_journal.assert_called_once_with("1234-5678")
+        mk_extrated_selected_journal.assert_called_once_with(
+            "1234-5678", max_workers=None, from_date=None, until_date=None
+        )
+
+    @patch("documentstore_migracao.processing.extrated.extrated_all_data")
+    def test_arg_issn_journal_many(self, mk_extrated_all_data):
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            issn_path = os.path.join(tmpdir, "issns.txt")
+            with open(issn_path, "w") as f:
+                f.write("0036-3634\n0001-3765\n")
+
+            process(
+                [
+                    "-j",
+                    "1234-5678",
+                    "--issn-file",
+                    issn_path,
+                    "--exclude-issn",
+                    "0001-3765",
+                    "--max-journals",
+                    "2",
+                ]
+            )
+
+        mk_extrated_all_data.assert_called_once_with(
+            max_workers=None,
+            from_date=None,
+            until_date=None,
+            issns=["1234-5678", "0036-3634"],
+            exclude_issns=["0001-3765"],
+            max_journals=2,
+        )
+
+    @patch("documentstore_migracao.processing.extrated.extrated_all_data")
+    def test_arg_extrateFiles_with_exclude_issn(self, mk_extrated_all_data):
+
+        process(["-e", "--exclude-issn", "0036-3634", "--exclude-issn", "0001-3765"])
+        mk_extrated_all_data.assert_called_once_with(
+            max_workers=None,
+            from_date=None,
+            until_date=None,
+            issns=None,
+            exclude_issns=["0036-3634", "0001-3765"],
+            max_journals=None,
+        )
 
     @patch("documentstore_migracao.processing.conversion.conversion_article_ALLxml")
     def test_arg_conversionFiles(self, mk_conversion_article_ALLxml):
 
         process(["--conversionFiles"])
-        mk_conversion_article_ALLxml.assert_called_once_with()
+        mk_conversion_article_ALLxml.assert_called_once_with(workers=None)
+
+    @patch("documentstore_migracao.processing.validation.validation_article_ALLxml")
+    def test_arg_validateFiles(self, mk_validation_article_ALLxml):
+
+        process(["--validateFiles"])
+        mk_validation_article_ALLxml.assert_called_once_with(workers=None)
+
+    @patch("documentstore_migracao.processing.pipeline.pipeline_all_data")
+    def test_arg_pipeline(self, mk_pipeline_all_data):
+
+        process(["--pipeline", "--issn-journal", "1234-5678", "--workers", "4"])
+        mk_pipeline_all_data.assert_called_once_with(
+            issns=["1234-5678"],
+            exclude_issns=None,
+            max_workers=4,
+            max_journals=None,
+            workers=4,
+            from_date=None,
+            until_date=None,
+        )
+
+    @patch("documentstore_migracao.processing.conversion.conversion_article_ALLxml")
+    def test_arg_metrics_file(self, mk_conversion_article_ALLxml):
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            metrics_path = os.path.join(tmpdir, "metrics.json")
+            process(["--conversionFiles", "--metrics-file", metrics_path])
+
+            with open(metrics_path) as f:
+                self.assertIn("counters", json.load(f))
+
+    @patch("documentstore_migracao.main.configure_bulk_logger")
+    @patch("documentstore_migracao.processing.conversion.conversion_article_ALLxml")
+    def test_arg_bulk_log(self, mk_conversion_article_ALLxml, mk_configure_bulk_logger):
+
+        process(["--conversionFiles", "--bulk-log"])
+        mk_configure_bulk_logger.assert_called_once_with()
+        mk_configure_bulk_logger.return_value.stop.assert_called_once_with()
 
     @patch("documentstore_migracao.processing.conversion.conversion_article_xml")
     def test_arg_pathFile(self, mk_conversion_article_xml):
@@ -33,7 +174,60 @@ class TestMainProcess(unittest.TestCase):
     def test_arg_readFiles(self, mk_reading_article_ALLxml):
 
         process(["--readFiles"])
-        mk_reading_article_ALLxml.assert_called_once_with()
+        mk_reading_article_ALLxml.assert_called_once_with(workers=None)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestMainProgress(unittest.TestCase):
+    @patch("documentstore_migracao.main.setup")
+    @patch("documentstore_migracao.processing.conversion.conversion_article_ALLxml")
+    def test_progress_line_with_default_loglevel(
+        self, mk_conversion_article_ALLxml, mk_setup
+    ):
+
+        root = logging.getLogger()
+        handler = ListHandler()
+        root.addHandler(handler)
+        self.addCleanup(root.removeHandler, handler)
+        self.addCleanup(root.setLevel, root.level)
+
+        process(["--conversionFiles"])
+
+        messages = [record.getMessage() for record in handler.records]
+        self.assertEqual(len(messages), 1)
+        self.assertIn("Progresso", messages[0])
+
+
+class TestMainSetup(unittest.TestCase):
+    @patch("documentstore_migracao.utils.files.setup_processing_folder")
+    @patch("documentstore_migracao.main.configure_logger")
+    def test_setup_runs_once(self, mk_configure_logger, mk_setup_processing_folder):
+
+        with patch.object(main_module, "_setup_done", False):
+            main_module.setup()
+            main_module.setup()
+
+        mk_configure_logger.assert_called_once_with()
+        mk_setup_processing_folder.assert_called_once_with()
+
+    @patch("documentstore_migracao.main.setup")
+    @patch("documentstore_migracao.main.get_version")
+    def test_arg_version(self, mk_get_version, mk_setup):
+
+        mk_get_version.return_value = "0.1"
+        with patch("sys.stdout"), patch("sys.stderr"):
+            self.assertRaises(SystemExit, process, ["--version"])
+
+        mk_get_version.assert_called_once_with()
+        mk_setup.assert_not_called()
 
 
 class TestMainMain(unittest.TestCase):
@@ -1,9 +1,19 @@
 import os
+import json
+import shutil
+import tempfile
 import unittest
-from unittest.mock import patch, ANY
+from unittest.mock import patch, ANY, AsyncMock
 
 from xylose.scielodocument import Journal
-from documentstore_migracao.processing import extrated, conversion, reading
+from documentstore_migracao.processing import (
+    extrated,
+    conversion,
+    reading,
+    validation,
+    pipeline,
+)
+from documentstore_migracao.utils import manifest, files
 
 from . import utils, SAMPLES_PATH, SAMPLES_JOURNAL, SAMPLES_XML_ARTICLE
 
@@ -12,17 +22,56 @@ class TestProcessingExtrated(unittest.TestCase):
     def setUp(self):
         self.obj_journal = Journal(SAMPLES_JOURNAL)
 
-    @patch("documentstore_migracao.processing.extrated.article.get_all_articles_notXML")
-    def test_extrated_journal_data(self, mk_get_all_articles_notXML):
+    @patch("documentstore_migracao.processing.extrated.article.iter_articles")
+    def test_extrated_journal_data(self, mk_iter_articles):
 
-        mk_get_all_articles_notXML.return_value = [
-            ("S0036-36341997000100001", SAMPLES_XML_ARTICLE)
+        mk_iter_articles.return_value = [
+            (
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"},
+                "html",
+                SAMPLES_XML_ARTICLE,
+            )
         ]
-        with utils.environ(SOURCE_PATH="/tmp"):
-            extrated.extrated_journal_data(self.obj_journal)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = os.path.join(tmpdir, "manifest.db")
+            with utils.environ(SOURCE_PATH=tmpdir, MANIFEST_PATH=manifest_path):
+                extrated.extrated_journal_data(self.obj_journal)
 
-            self.assertTrue(os.path.isfile("/tmp/S0036-36341997000100001.xml"))
-            os.remove("/tmp/S0036-36341997000100001.xml")
+                file_path = os.path.join(
+                    tmpdir, "0036-3634", "S0036-36341997000100001.xml"
+                )
+                self.assertTrue(os.path.isfile(file_path))
+
+                obj_manifest = manifest.Manifest(manifest_path)
+                row = obj_manifest.get("S0036-36341997000100001")
+                obj_manifest.close()
+                self.assertEqual(row["processing_date"], "2018-01-01")
+                self.assertEqual(row["path"], file_path)
+
+    @patch(
+        "documentstore_migracao.processing.extrated.article.ext_article_with_version"
+    )
+    @patch("documentstore_migracao.processing.extrated.article.ext_identifiers")
+    def test_extrated_journal_data_skips_unchanged(
+        self, mk_ext_identifiers, mk_ext_article_with_version
+    ):
+
+        mk_ext_identifiers.return_value = {
+            "objects": [
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"}
+            ]
+        }
+        mk_ext_article_with_version.return_value = ("html", SAMPLES_XML_ARTICLE)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with utils.environ(
+                SOURCE_PATH=tmpdir, MANIFEST_PATH=os.path.join(tmpdir, "manifest.db")
+            ):
+                extrated.extrated_journal_data(self.obj_journal)
+                extrated.extrated_journal_data(self.obj_journal)
+
+        mk_ext_article_with_version.assert_called_once_with(
+            "S0036-36341997000100001", None
+        )
 
     @patch("documentstore_migracao.processing.extrated.extrated_journal_data")
     def test_extrated_selected_journal(self, mk_extrated_journal_data):
@@ -31,16 +80,90 @@ class TestProcessingExtrated(unittest.TestCase):
         # mk_extrated_journal_data.assert_called_once_with(self.obj_journal)
         self.assertTrue(True)
 
-    @patch("documentstore_migracao.processing.extrated.journal.get_all_journal")
-    @patch("documentstore_migracao.processing.extrated.extrated_journal_data")
-    def test_extrated_all_data(self, mk_extrated_journal_data, mk_get_all_journal):
+    @patch("documentstore_migracao.processing.extrated.journal.iter_all_journal")
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_extrated_all_data(self, mk_iter_journals_articles, mk_iter_all_journal):
+
+        mk_iter_all_journal.return_value = iter([self.obj_journal])
+        mk_iter_journals_articles.return_value = [
+            (
+                "0036-3634",
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"},
+                "html",
+                SAMPLES_XML_ARTICLE,
+            )
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = os.path.join(tmpdir, "manifest.db")
+            with utils.environ(SOURCE_PATH=tmpdir, MANIFEST_PATH=manifest_path):
+                extrated.extrated_all_data(
+                    issns=["0036-3634", "1234-5678"],
+                    exclude_issns=["1234-5678"],
+                    max_journals=2,
+                )
 
-        mk_get_all_journal.return_value = [self.obj_journal]
-        extrated.extrated_all_data()
-        mk_extrated_journal_data.assert_called_once_with(self.obj_journal)
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(tmpdir, "0036-3634", "S0036-36341997000100001.xml")
+                )
+            )
+
+        mk_iter_all_journal.assert_called_once_with(
+            ["0036-3634", "1234-5678"], ["1234-5678"]
+        )
+        mk_iter_journals_articles.assert_called_once_with(
+            ANY,
+            max_workers=None,
+            max_journals=2,
+            from_date=None,
+            until_date=None,
+            skip=ANY,
+            versions=ANY,
+        )
+
+    def test_extrated_all_data_async(self):
+
+        obj_journal = self.obj_journal
+
+        async def iter_all_journal(client, issns, exclude_issns):
+            yield obj_journal
+
+        async def iter_article_identifiers(client, issn, from_date, until_date):
+            yield {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"}
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.multiple(
+            "documentstore_migracao.export.aio.ArticleMetaClient",
+            iter_all_journal=iter_all_journal,
+            iter_article_identifiers=iter_article_identifiers,
+            ext_article_with_version=AsyncMock(
+                return_value=("html", SAMPLES_XML_ARTICLE)
+            ),
+        ):
+            manifest_path = os.path.join(tmpdir, "manifest.db")
+            with utils.environ(SOURCE_PATH=tmpdir, MANIFEST_PATH=manifest_path):
+                extrated.extrated_all_data_async(issns=["0036-3634"])
+
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(tmpdir, "0036-3634", "S0036-36341997000100001.xml")
+                )
+            )
+            obj_manifest = manifest.Manifest(manifest_path)
+            self.addCleanup(obj_manifest.close)
+            self.assertEqual(
+                obj_manifest.get_version("S0036-36341997000100001"), "html"
+            )
 
 
 class TestProcessingConversion(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = utils.tmpdir_environ(
+            self, CONVERSION_PATH="conversion", MANIFEST_PATH="manifest.db"
+        )
+
+        self.conversion_path = os.path.join(self.tmpdir, "conversion")
+        os.makedirs(self.conversion_path)
+
     def test_conversion_article_xml(self):
 
         conversion.conversion_article_xml(
@@ -62,38 +185,480 @@ class TestProcessingConversion(unittest.TestCase):
         mk_conversion_article_xml.side_effect = KeyError("Test Error - CONVERSION")
         with utils.environ(SOURCE_PATH=SAMPLES_PATH):
 
-            with self.assertRaises(KeyError) as cm:
-                conversion.conversion_article_ALLxml()
+            with self.assertLogs("documentstore_migracao.processing.conversion") as log:
+                summary = conversion.conversion_article_ALLxml()
+
+        self.assertEqual(summary["success"], 0)
+        self.assertEqual(len(summary["failures"]), 6)
+        self.assertIn("Test Error - CONVERSION", summary["failures"][0][1])
+
+        has_message = False
+        for log_message in log.output:
+            if "Test Error - CONVERSION" in log_message:
+                has_message = True
+        self.assertTrue(has_message)
+
+    def test_conversion_article_ALLxml_with_workers(self):
+
+        with utils.environ(SOURCE_PATH=SAMPLES_PATH):
+            summary = conversion.conversion_article_ALLxml(workers=2)
+
+        self.assertEqual(len(os.listdir(self.conversion_path)), summary["success"])
+        self.assertEqual(summary["success"] + len(summary["failures"]), 6)
+        self.assertGreaterEqual(sum(summary["parsers"].values()), summary["success"])
+
+    def test_conversion_article_ALLxml_skips_unchanged(self):
+
+        with utils.environ(SOURCE_PATH=SAMPLES_PATH):
+            first = conversion.conversion_article_ALLxml()
+            second = conversion.conversion_article_ALLxml()
+
+        self.assertEqual(second["success"], 0)
+        self.assertEqual(second["unchanged"], first["success"])
+        self.assertEqual(len(second["failures"]), len(first["failures"]))
+
+    def test_conversion_article_ALLxml_converter_changed(self):
+
+        with utils.environ(SOURCE_PATH=SAMPLES_PATH):
+            first = conversion.conversion_article_ALLxml()
+            with patch(
+                "documentstore_migracao.processing.conversion.converter_version",
+                return_value="new-version",
+            ):
+                second = conversion.conversion_article_ALLxml()
+
+        self.assertEqual(second["success"], first["success"])
+        self.assertEqual(second["unchanged"], 0)
+
+    def test_conversion_article_ALLxml_skips_read(self):
+
+        success_path = os.path.join(self.tmpdir, "success")
+        with utils.environ(
+            SOURCE_PATH=SAMPLES_PATH, SUCCESS_PROCESSING_PATH=success_path
+        ):
+            first = conversion.conversion_article_ALLxml()
+            shutil.move(self.conversion_path, success_path)
+            second = conversion.conversion_article_ALLxml()
 
-                self.assertEqual("Test Error - CONVERSION", str(cm.exception))
+        self.assertEqual(second["success"], 0)
+        self.assertEqual(second["unchanged"], first["success"])
+
+    def test_conversion_article_ALLxml_sharded(self):
+
+        source_path = os.path.join(self.tmpdir, "source")
+        os.makedirs(os.path.join(source_path, "0036-3634"))
+        shutil.copy(
+            os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml"),
+            os.path.join(source_path, "0036-3634"),
+        )
+
+        with utils.environ(SOURCE_PATH=source_path):
+            summary = conversion.conversion_article_ALLxml()
+
+        self.assertEqual(summary["success"], 1)
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(
+                    self.conversion_path, "0036-3634", "S0036-36341997000100001.xml"
+                )
+            )
+        )
 
 
 class TestProcessingReading(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = utils.tmpdir_environ(
+            self,
+            CONVERSION_PATH="conversion",
+            SUCCESS_PROCESSING_PATH="success",
+            QUARANTINE_PATH="quarantine",
+            MEDIA_MANIFEST_PATH="media.jsonl",
+        )
+
+        self.conversion_path = os.path.join(self.tmpdir, "conversion")
+        self.success_path = os.path.join(self.tmpdir, "success")
+        self.quarantine_path = os.path.join(self.tmpdir, "quarantine")
+        self.media_manifest_path = os.path.join(self.tmpdir, "media.jsonl")
+
+        shutil.copytree(SAMPLES_PATH, self.conversion_path)
+
     def test_reading_article_xml(self):
 
         reading.reading_article_xml(
-            os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml")
+            os.path.join(self.conversion_path, "S0036-36341997000100001.xml")
+        )
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(self.success_path, "S0036-36341997000100001.xml")
+            )
+        )
+
+    def test_reading_article_xml_sharded(self):
+
+        file_xml_path = files.shard_path(
+            self.conversion_path, "0036-3634", "S0036-36341997000100001.xml"
+        )
+        os.rename(
+            os.path.join(self.conversion_path, "S0036-36341997000100001.xml"),
+            file_xml_path,
+        )
+
+        reading.reading_article_xml(file_xml_path)
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(
+                    self.success_path, "0036-3634", "S0036-36341997000100001.xml"
+                )
+            )
         )
 
     @patch("documentstore_migracao.processing.reading.reading_article_xml")
     def test_reading_article_ALLxml(self, mk_reading_article_xml):
 
-        with utils.environ(CONVERSION_PATH=SAMPLES_PATH):
+        mk_reading_article_xml.return_value = []
+        reading.reading_article_ALLxml()
+        mk_reading_article_xml.assert_called_with(ANY, move_success=True)
+        self.assertEqual(len(mk_reading_article_xml.mock_calls), 6)
+
+    @patch("documentstore_migracao.processing.reading.files.append_jsonl")
+    @patch("documentstore_migracao.processing.reading.reading_article_xml")
+    def test_reading_article_ALLxml_batches_media_manifest(
+        self, mk_reading_article_xml, mk_append_jsonl
+    ):
+
+        mk_reading_article_xml.return_value = [{"kind": "img", "path": "/a.gif"}]
+        with utils.environ(PROCESSPOOL_CHUNKSIZE="4"):
             reading.reading_article_ALLxml()
-            mk_reading_article_xml.assert_called_with(ANY, move_success=False)
-            self.assertEqual(len(mk_reading_article_xml.mock_calls), 6)
+
+        self.assertEqual(
+            [len(rows) for (_, rows), _ in mk_append_jsonl.call_args_list], [4, 2]
+        )
+
+    @patch("documentstore_migracao.processing.reading.reading_article_xml")
+    def test_reading_article_ALLxml_media_manifest(self, mk_reading_article_xml):
+
+        mk_reading_article_xml.return_value = [
+            {"kind": "img", "path": "/img/revistas/spm/v45n4/a04qdr04.gif"}
+        ]
+        # as midias de uma execucao anterior sao mantidas
+        with open(self.media_manifest_path, "w") as f:
+            f.write(json.dumps({"article": "S0000-00000000000000000"}) + "\n")
+
+        reading.reading_article_ALLxml()
+
+        with open(self.media_manifest_path) as f:
+            rows = [json.loads(line) for line in f]
+
+        self.assertEqual(len(rows), 7)
+        self.assertIn({"article": "S0000-00000000000000000"}, rows)
+        self.assertIn(
+            {
+                "article": "S0036-36341997000100001",
+                "kind": "img",
+                "path": "/img/revistas/spm/v45n4/a04qdr04.gif",
+            },
+            rows,
+        )
 
     @patch("documentstore_migracao.processing.reading.reading_article_xml")
     def test_reading_article_ALLxml_with_exception(self, mk_reading_article_xml):
 
         mk_reading_article_xml.side_effect = KeyError("Test Error - READING")
-        with utils.environ(CONVERSION_PATH=SAMPLES_PATH):
 
-            with self.assertLogs("documentstore_migracao.processing.reading") as log:
-                reading.reading_article_ALLxml()
+        with self.assertLogs("documentstore_migracao.processing.reading") as log:
+            summary = reading.reading_article_ALLxml()
+
+        has_message = False
+        for log_message in log.output:
+            if "Test Error - READING" in log_message:
+                has_message = True
+        self.assertTrue(has_message)
+        self.assertEqual(len(summary["failures"]), 6)
+        self.assertEqual(len(os.listdir(self.quarantine_path)), 6)
+
+    def test_reading_article_ALLxml_with_workers(self):
+
+        summary = reading.reading_article_ALLxml(workers=2)
+
+        self.assertEqual(summary["success"] + len(summary["failures"]), 6)
+        self.assertEqual(len(os.listdir(self.success_path)), summary["success"])
+        self.assertEqual(files.list_dir(self.conversion_path), [])
+
+
+class TestProcessingValidation(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = utils.tmpdir_environ(
+            self, CONVERSION_PATH="conversion", VALIDATION_REPORT_PATH="validation"
+        )
+
+        self.conversion_path = os.path.join(self.tmpdir, "conversion")
+        self.report_path = os.path.join(self.tmpdir, "validation")
+
+        shutil.copytree(SAMPLES_PATH, self.conversion_path)
+
+    def test_validation_article_xml(self):
+
+        errors = validation.validation_article_xml(
+            os.path.join(self.conversion_path, "S0036-36341997000100001.xml")
+        )
+        self.assertTrue(errors)
+        self.assertEqual(set(errors[0]), {"line", "level", "message"})
+
+    def test_get_validators_loaded_once(self):
+
+        self.assertIs(
+            validation.get_validators("sps-1.4"), validation.get_validators("sps-1.4")
+        )
+
+    def test_validation_article_ALLxml(self):
+
+        summary = validation.validation_article_ALLxml()
+
+        self.assertEqual(
+            summary["valid"] + summary["invalid"] + len(summary["failures"]), 6
+        )
+        with open(os.path.join(self.report_path, "S0036-36341997000100001.json")) as f:
+            report = json.load(f)
+        self.assertTrue(report["errors"])
+        self.assertEqual(len(files.list_dir(self.conversion_path)), 6)
+
+    @patch("documentstore_migracao.processing.validation.validation_article_xml")
+    def test_validation_article_ALLxml_valid(self, mk_validation_article_xml):
+
+        os.makedirs(self.report_path)
+        stale_report = os.path.join(self.report_path, "S0036-36341997000100001.json")
+        files.write_file(stale_report, "{}")
+        mk_validation_article_xml.return_value = []
+
+        summary = validation.validation_article_ALLxml()
+
+        self.assertEqual(summary["valid"], 6)
+        self.assertFalse(os.path.exists(stale_report))
+
+    @patch("documentstore_migracao.processing.validation.validation_article_xml")
+    def test_validation_article_ALLxml_with_exception(self, mk_validation_article_xml):
+
+        mk_validation_article_xml.side_effect = KeyError("Test Error - VALIDATION")
+
+        with self.assertLogs("documentstore_migracao.processing.validation") as log:
+            summary = validation.validation_article_ALLxml()
+
+        self.assertTrue(
+            any("Test Error - VALIDATION" in message for message in log.output)
+        )
+        self.assertEqual(len(summary["failures"]), 6)
+
+    def test_validation_article_ALLxml_with_workers(self):
+
+        summary = validation.validation_article_ALLxml(workers=2)
+
+        self.assertEqual(
+            summary["valid"] + summary["invalid"] + len(summary["failures"]), 6
+        )
+
+
+class TestProcessingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = utils.tmpdir_environ(
+            self,
+            SOURCE_PATH="source",
+            CONVERSION_PATH="conversion",
+            SUCCESS_PROCESSING_PATH="success",
+            QUARANTINE_PATH="quarantine",
+            VALIDATION_REPORT_PATH="validation",
+            MANIFEST_PATH="manifest.db",
+            MEDIA_MANIFEST_PATH="media.jsonl",
+        )
+
+        self.source_path = os.path.join(self.tmpdir, "source")
+        self.success_path = os.path.join(self.tmpdir, "success")
+        self.manifest_path = os.path.join(self.tmpdir, "manifest.db")
+        self.media_manifest_path = os.path.join(self.tmpdir, "media.jsonl")
+        self.report_path = os.path.join(self.tmpdir, "validation")
+
+        patcher = patch("documentstore_migracao.export.journal.iter_all_journal")
+        self.mk_iter_all_journal = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mk_iter_all_journal.return_value = [Journal(SAMPLES_JOURNAL)]
+
+    def extract_articles(self, total):
+        """ codes of the articles saved as by an extraction out of the
+        pipeline """
+
+        codes = ["S0036-3634199700010000%s" % i for i in range(1, total + 1)]
+        obj_manifest = manifest.Manifest(self.manifest_path)
+        for code in codes:
+            file_path = files.shard_path(self.source_path, "0036-3634", code + ".xml")
+            files.write_file(file_path, SAMPLES_XML_ARTICLE)
+            obj_manifest.update(code, "2018-01-01", "html", None, file_path)
+        obj_manifest.close()
+        return codes
+
+    def get_stage(self, code):
+        obj_manifest = manifest.Manifest(self.manifest_path)
+        self.addCleanup(obj_manifest.close)
+        return obj_manifest.get_stage(code)
+
+    @patch("documentstore_migracao.processing.reading.xml.find_medias")
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data(self, mk_iter_journals_articles, mk_find_medias):
+
+        mk_iter_journals_articles.return_value = [
+            (
+                "0036-3634",
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"},
+                "html",
+                SAMPLES_XML_ARTICLE,
+            )
+        ]
+        mk_find_medias.return_value = [{"kind": "img", "path": "/img/a01.gif"}]
+        summary = pipeline.pipeline_all_data()
+
+        self.assertEqual(summary["success"], 1)
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(
+                    self.success_path, "0036-3634", "S0036-36341997000100001.xml"
+                )
+            )
+        )
+        self.assertEqual(self.get_stage("S0036-36341997000100001"), pipeline.DONE)
+        with open(self.media_manifest_path) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "article": "S0036-36341997000100001",
+                    "kind": "img",
+                    "path": "/img/a01.gif",
+                }
+            ],
+        )
+
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_resumes_extracted(self, mk_iter_journals_articles):
+
+        mk_iter_journals_articles.return_value = []
+        file_path = files.shard_path(
+            self.source_path, "0036-3634", "S0036-36341997000100001.xml"
+        )
+        files.write_file(file_path, SAMPLES_XML_ARTICLE)
+        obj_manifest = manifest.Manifest(self.manifest_path)
+        obj_manifest.set_stage("S0036-36341997000100001", pipeline.EXTRACTED, file_path)
+        obj_manifest.close()
+
+        summary = pipeline.pipeline_all_data()
+
+        self.assertEqual(summary["resumed"], 1)
+        self.assertEqual(summary["success"], 1)
+        self.assertEqual(self.get_stage("S0036-36341997000100001"), pipeline.DONE)
+
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_resumes_extraction(self, mk_iter_journals_articles):
+
+        mk_iter_journals_articles.return_value = []
+        codes = self.extract_articles(2)
+        # com falha em uma execucao anterior, so e refeito se mudar
+        obj_manifest = manifest.Manifest(self.manifest_path)
+        obj_manifest.set_stage(codes[1], pipeline.FAILED, "path", "KeyError")
+        obj_manifest.close()
+
+        summary = pipeline.pipeline_all_data()
+
+        self.assertEqual(summary["resumed"], 1)
+        self.assertEqual(summary["success"], 1)
+        self.assertEqual(self.get_stage(codes[0]), pipeline.DONE)
+        self.assertEqual(self.get_stage(codes[1]), pipeline.FAILED)
+
+        summary = pipeline.pipeline_all_data()
+        self.assertEqual(summary["resumed"], 0)
+
+        # a conversão do pipeline é registrada para o --conversionFiles
+        with utils.environ(SUCCESS_PROCESSING_PATH=self.success_path):
+            conversion_summary = conversion.conversion_article_ALLxml()
+        self.assertEqual(conversion_summary["unchanged"], 1)
+
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_after_conversion(self, mk_iter_journals_articles):
+
+        mk_iter_journals_articles.return_value = []
+        codes = self.extract_articles(2)
+        summary = conversion.conversion_article_ALLxml()
+        self.assertEqual(summary["success"], 2)
+
+        with patch(
+            "documentstore_migracao.processing.conversion._conversion_article_xml"
+        ) as mk_conversion_article_xml:
+            summary = pipeline.pipeline_all_data()
+
+        self.assertEqual(summary["resumed"], 2)
+        self.assertEqual(summary["success"], 2)
+        mk_conversion_article_xml.assert_not_called()
+        for code in codes:
+            self.assertEqual(self.get_stage(code), pipeline.DONE)
+
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_after_reading(self, mk_iter_journals_articles):
+
+        mk_iter_journals_articles.return_value = []
+        codes = self.extract_articles(2)
+        conversion.conversion_article_ALLxml()
+        reading.reading_article_ALLxml()
+        with open(self.media_manifest_path) as f:
+            media_rows = f.read()
+
+        summary = pipeline.pipeline_all_data()
+
+        self.assertEqual(summary["resumed"], 0)
+        self.assertEqual(summary["success"], 0)
+        for code in codes:
+            self.assertEqual(self.get_stage(code), pipeline.DONE)
+        with open(self.media_manifest_path) as f:
+            self.assertEqual(f.read(), media_rows)
+
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_validates(self, mk_iter_journals_articles):
+
+        mk_iter_journals_articles.return_value = [
+            (
+                "0036-3634",
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"},
+                "html",
+                SAMPLES_XML_ARTICLE,
+            )
+        ]
+        summary = pipeline.pipeline_all_data()
+
+        # os arquivos convertidos ainda não seguem a DTD, somente o relatório
+        # é gravado e a leitura segue
+        self.assertEqual(summary["invalid"], 1)
+        self.assertEqual(summary["success"], 1)
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(
+                    self.report_path, "0036-3634", "S0036-36341997000100001.json"
+                )
+            )
+        )
+
+    @patch("documentstore_migracao.processing.conversion.conversion_article_xml")
+    @patch("documentstore_migracao.processing.extrated.article.iter_journals_articles")
+    def test_pipeline_all_data_with_exception(
+        self, mk_iter_journals_articles, mk_conversion_article_xml
+    ):
+
+        mk_iter_journals_articles.return_value = [
+            (
+                "0036-3634",
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"},
+                "html",
+                SAMPLES_XML_ARTICLE,
+            )
+        ]
+        mk_conversion_article_xml.side_effect = KeyError("Test Error - PIPELINE")
+
+        summary = pipeline.pipeline_all_data()
 
-            has_message = False
-            for log_message in log.output:
-                if "Test Error - READING" in log_message:
-                    has_message = True
-            self.assertTrue(has_message)
+        self.assertEqual(len(summary["failures"]), 1)
+        self.assertEqual(self.get_stage("S0036-36341997000100001"), pipeline.FAILED)
@@ -1,23 +1,68 @@
 import os
+import sys
+import json
+import time
+import logging
+import tempfile
 import unittest
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor, Future
+from unittest.mock import patch, ANY, MagicMock
 from lxml import etree
 
-from documentstore_migracao.utils import files, xml, request
+from documentstore_migracao.utils import (
+    files,
+    xml,
+    request,
+    parallel,
+    manifest,
+    metrics,
+    logger,
+)
 from documentstore_migracao.utils.convert_html_body import Convert2SPSBody
-from . import SAMPLES_PATH
+from . import utils, SAMPLES_PATH
 
 
 class TestUtilsFiles(unittest.TestCase):
     def test_list_dir(self):
         self.assertEqual(len(files.list_dir(SAMPLES_PATH)), 6)
 
+    def test_iter_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files.write_file(os.path.join(tmpdir, "a.xml"), "<a/>")
+            files.write_file(os.path.join(tmpdir, "a.txt"), "a")
+            files.write_file(files.shard_path(tmpdir, "1234-5678", "b.xml"), "<b/>")
+
+            self.assertEqual(
+                list(files.iter_dir(tmpdir)), [os.path.join(tmpdir, "a.xml")]
+            )
+            self.assertEqual(
+                sorted(files.iter_dir(tmpdir, recursive=True)),
+                [
+                    os.path.join(tmpdir, "1234-5678", "b.xml"),
+                    os.path.join(tmpdir, "a.xml"),
+                ],
+            )
+
+    def test_relative_path(self):
+        self.assertEqual(
+            files.relative_path("/xml/source/1234-5678/a.xml", "/xml/source"),
+            os.path.join("1234-5678", "a.xml"),
+        )
+        self.assertEqual(files.relative_path("/tmp/a.xml", "/xml/source"), "a.xml")
+
     def test_read_file(self):
         data = files.read_file(
             os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml")
         )
         self.assertIn("0036-3634", data)
 
+    def test_read_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "issns.txt")
+            files.write_file(path, "# periodicos\n0036-3634\n\n 1234-5678 \n")
+
+            self.assertEqual(files.read_lines(path), ["0036-3634", "1234-5678"])
+
     def test_write_file(self):
         expected_text = "<a><b>bar</b></a>"
         filename = "foo_test.txt"
@@ -32,6 +77,111 @@ class TestUtilsFiles(unittest.TestCase):
 
         self.assertEqual(expected_text, text)
 
+    def test_read_xml(self):
+        obj = files.read_xml(os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml"))
+        self.assertEqual(obj.tag, "article")
+
+    def test_write_xml(self):
+        obj = etree.fromstring("<a><b>Salud Pública</b></a>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "foo_test.xml")
+            files.write_xml(filename, obj)
+
+            with open(filename, "rb") as f:
+                data = f.read()
+
+        self.assertEqual(data, "<a><b>Salud Pública</b></a>".encode("utf-8"))
+
+
+class TestUtilsManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, "S0036-36341997000100001.xml")
+        files.write_file(self.file_path, "<article/>")
+        self.manifest = manifest.Manifest(os.path.join(self.tmpdir.name, "manifest.db"))
+        self.manifest.update(
+            "S0036-36341997000100001",
+            "2018-01-01",
+            "html",
+            manifest.checksum("<article/>"),
+            self.file_path,
+        )
+
+    def tearDown(self):
+        self.manifest.close()
+        self.tmpdir.cleanup()
+
+    def test_is_unchanged(self):
+        self.assertTrue(
+            self.manifest.is_unchanged(
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"}
+            )
+        )
+
+    def test_is_unchanged_new_processing_date(self):
+        self.assertFalse(
+            self.manifest.is_unchanged(
+                {"code": "S0036-36341997000100001", "processing_date": "2019-01-01"}
+            )
+        )
+
+    def test_is_unchanged_unknown_article(self):
+        self.assertFalse(
+            self.manifest.is_unchanged(
+                {"code": "S0036-36341997000100002", "processing_date": "2018-01-01"}
+            )
+        )
+
+    def test_is_unchanged_modified_file(self):
+        files.write_file(self.file_path, "<article>changed</article>")
+        self.assertFalse(
+            self.manifest.is_unchanged(
+                {"code": "S0036-36341997000100001", "processing_date": "2018-01-01"}
+            )
+        )
+
+    def test_get_version(self):
+        self.assertEqual(self.manifest.get_version("S0036-36341997000100001"), "html")
+        self.assertIsNone(self.manifest.get_version("S0036-36341997000100002"))
+
+    def test_is_unchanged_xml_version(self):
+        self.manifest.update("S0036-36341997000100002", "2018-01-01", "xml")
+        self.assertTrue(
+            self.manifest.is_unchanged(
+                {"code": "S0036-36341997000100002", "processing_date": "2018-01-01"}
+            )
+        )
+
+    def test_stage(self):
+        self.assertIsNone(self.manifest.get_stage("S0036-36341997000100001"))
+        self.manifest.set_stage("S0036-36341997000100001", "extracted", self.file_path)
+        self.manifest.set_stage("S0036-36341997000100002", "done")
+
+        self.assertEqual(
+            self.manifest.get_stage("S0036-36341997000100001"), "extracted"
+        )
+        self.assertEqual(
+            [row["path"] for row in self.manifest.list_stage("extracted")],
+            [self.file_path],
+        )
+
+    def test_list_unfinished(self):
+        self.manifest.update("S0036-36341997000100001", "2018-01-01", "html", None, "a")
+        self.manifest.update("S0036-36341997000100002", "2018-01-01", "html", None, "b")
+        self.manifest.update("S0036-36341997000100003", "2018-01-01", "xml")
+        self.manifest.set_stage("S0036-36341997000100002", "done", "b")
+        self.manifest.set_stage("S0036-36341997000100004", "failed", "d", "KeyError")
+
+        self.assertEqual(
+            sorted(row["code"] for row in self.manifest.list_unfinished(["done"])),
+            ["S0036-36341997000100001", "S0036-36341997000100004"],
+        )
+        self.assertEqual(
+            [row["code"] for row in self.manifest.list_unfinished(["done", "failed"])],
+            ["S0036-36341997000100001"],
+        )
+
 
 class TestUtilsXML(unittest.TestCase):
     def test_str2objXML(self):
@@ -41,6 +191,34 @@ class TestUtilsXML(unittest.TestCase):
 
         self.assertIn(expected_text, str(etree.tostring(obj)))
 
+    def test_str2objXML_recovers_malformed_html(self):
+
+        xml.PARSE_STATS.clear()
+        obj = xml.str2objXML('texto <p>a <b>negrito</p>&nbsp;<IMG SRC="a.gif"> fim')
+
+        self.assertEqual(xml.PARSE_STATS, {"html": 1})
+        self.assertEqual(obj.text, "texto ")
+        self.assertEqual(obj.find("p/b").text, "negrito")
+        self.assertEqual(obj.find("img").get("src"), "a.gif")
+        self.assertEqual(obj.find("img").tail, " fim")
+
+    def test_str2objXML_keeps_content_after_stray_closing_tag(self):
+
+        xml.PARSE_STATS.clear()
+        obj = xml.str2objXML("<p>x</p></div> meio <p>after</p>")
+
+        self.assertEqual(xml.PARSE_STATS, {"html": 1})
+        self.assertEqual([p.text for p in obj.findall("p")], ["x", "after"])
+        self.assertEqual(obj.find("p").tail, " meio ")
+
+    def test_str2objXML_xml_fast_path(self):
+
+        xml.PARSE_STATS.clear()
+        xml.str2objXML("<p>a</p>")
+        xml.str2objXML("<p>b</p>")
+
+        self.assertEqual(xml.PARSE_STATS, {"xml": 2})
+
     def test_find_medias(self):
 
         with open(os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml"), "r") as f:
@@ -50,6 +228,24 @@ class TestUtilsXML(unittest.TestCase):
 
         self.assertFalse(len(medias))
 
+    def test_find_medias_converted_body(self):
+
+        obj = etree.fromstring(
+            '<article xmlns:xlink="http://www.w3.org/1999/xlink"><body><sec><p>'
+            '<graphic xlink:href="/img/revistas/spm/v45n4/a04qdr04.gif"/>'
+            '<bold><a href="/img/revistas/spm/v45n4/a04.pdf">pdf</a></bold>'
+            '<a href="/pdf/outro.pdf">pdf</a></p></sec></body></article>'
+        )
+        medias = xml.find_medias(obj)
+
+        self.assertEqual(
+            medias,
+            [
+                {"kind": "img", "path": "/img/revistas/spm/v45n4/a04qdr04.gif"},
+                {"kind": "file", "path": "/img/revistas/spm/v45n4/a04.pdf"},
+            ],
+        )
+
     def test_parser_body_xml(self):
         with open(os.path.join(SAMPLES_PATH, "S0036-36341997000100003.xml"), "r") as f:
             text = f.read()
@@ -64,12 +260,171 @@ class TestUtilsXML(unittest.TestCase):
 
 
 class TestUtilsRequest(unittest.TestCase):
-    @patch("documentstore_migracao.utils.request.requests")
-    def test_get(self, mk_requests):
+    @patch("documentstore_migracao.utils.request.get_session")
+    def test_get(self, mk_get_session):
 
         expected = {"params": {"collection": "spa"}}
         request.get("http://api.test.com", **expected)
-        mk_requests.get.assert_called_once_with("http://api.test.com", **expected)
+        mk_get_session.return_value.get.assert_called_once_with(
+            "http://api.test.com", timeout=ANY, **expected
+        )
+
+    def test_get_session_is_shared(self):
+
+        self.assertIs(request.get_session(), request.get_session())
+
+    def test_create_session(self):
+
+        with utils.environ(REQUEST_RETRIES="7", REQUEST_POOL_SIZE="3"):
+            session = request.create_session()
+
+        adapter = session.get_adapter("http://api.test.com")
+        self.assertEqual(adapter.max_retries.total, 7)
+        self.assertEqual(adapter._pool_maxsize, 3)
+
+    @patch("documentstore_migracao.utils.request.time.sleep")
+    def test_rate_limiter(self, mk_sleep):
+
+        limiter = request.RateLimiter(2)
+        limiter.wait()
+        limiter.wait()
+        mk_sleep.assert_called_once_with(ANY)
+        self.assertLessEqual(mk_sleep.call_args[0][0], 0.5)
+
+    @patch("documentstore_migracao.utils.request.time.sleep")
+    def test_rate_limiter_disabled(self, mk_sleep):
+
+        limiter = request.RateLimiter(0)
+        limiter.wait()
+        limiter.wait()
+        mk_sleep.assert_not_called()
+
+    def test_iter_pages(self):
+
+        pages = {
+            0: {"meta": {"total": 5}, "objects": [1, 2]},
+            2: {"meta": {"total": 5}, "objects": [3, 4]},
+            4: {"meta": {"total": 5}, "objects": [5]},
+        }
+        fetch_page = MagicMock(side_effect=lambda offset, limit: pages[offset])
+
+        self.assertEqual(list(request.iter_pages(fetch_page, 2)), [1, 2, 3, 4, 5])
+        self.assertEqual(fetch_page.call_count, 3)
+
+    def test_iter_pages_stops_on_short_page(self):
+
+        fetch_page = MagicMock(return_value={"objects": [1, 2]})
+
+        self.assertEqual(list(request.iter_pages(fetch_page, 10)), [1, 2])
+        fetch_page.assert_called_once_with(0, 10)
+
+    def test_iter_pages_with_capped_limit(self):
+
+        # o ArticleMeta limita o limit, as paginas voltam menores que o pedido
+        def fetch_page(offset, limit):
+            objects = list(range(offset, min(offset + 1000, 2500)))
+            return {"meta": {"total": 2500}, "objects": objects}
+
+        self.assertEqual(len(list(request.iter_pages(fetch_page, 5000))), 2500)
+
+    def test_iter_pages_stops_on_empty_page(self):
+
+        fetch_page = MagicMock(return_value={"meta": {"total": 5}, "objects": []})
+
+        self.assertEqual(list(request.iter_pages(fetch_page, 10)), [])
+        fetch_page.assert_called_once_with(0, 10)
+
+
+def make_response(status_code=200, content=b"", headers=None):
+    response = request.requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    response.url = "http://api.test.com"
+    return response
+
+
+class TestUtilsRequestCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        patcher = patch("documentstore_migracao.utils.request.get_session")
+        self.mk_session = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def cache_environ(self, **kwargs):
+        kwargs.setdefault("REQUEST_CACHE_TTL", "3600")
+        return utils.environ(
+            REQUEST_CACHE_PATH=os.path.join(self.tmpdir.name, "cache"), **kwargs
+        )
+
+    def test_get_cached(self):
+
+        self.mk_session.get.return_value = make_response(content=b'{"a": 1}')
+        with self.cache_environ():
+            request.get("http://api.test.com", params={"code": "1"})
+            response = request.get("http://api.test.com", params={"code": "1"})
+
+        self.mk_session.get.assert_called_once()
+        self.assertEqual(response.json(), {"a": 1})
+        self.assertTrue(response.from_cache)
+
+    def test_get_cached_by_params(self):
+
+        self.mk_session.get.return_value = make_response(content=b"{}")
+        with self.cache_environ():
+            request.get("http://api.test.com", params={"code": "1"})
+            request.get("http://api.test.com", params={"code": "2"})
+
+        self.assertEqual(self.mk_session.get.call_count, 2)
+
+    def test_get_revalidated(self):
+
+        self.mk_session.get.side_effect = [
+            make_response(content=b'{"a": 1}', headers={"etag": '"v1"'}),
+            make_response(status_code=304),
+        ]
+        with self.cache_environ(REQUEST_CACHE_TTL="0"):
+            request.get("http://api.test.com")
+            response = request.get("http://api.test.com")
+
+        self.assertEqual(
+            self.mk_session.get.call_args[1]["headers"], {"If-None-Match": '"v1"'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"a": 1})
+
+    def test_get_disabled(self):
+
+        self.mk_session.get.return_value = make_response(content=b"{}")
+        request.get("http://api.test.com")
+        request.get("http://api.test.com")
+
+        self.assertEqual(self.mk_session.get.call_count, 2)
+
+    def test_evicts_least_recently_used(self):
+
+        cache = request.ResponseCache(self.tmpdir.name, 3600, 250)
+        for code in range(3):
+            cache.store(str(code), make_response(content=b"x" * 100))
+            os.utime(cache.entry_path(str(code)), (code, code))
+        cache.store("3", make_response(content=b"x" * 100))
+
+        self.assertIsNone(cache.load("0"))
+        self.assertIsNone(cache.load("1"))
+        self.assertIsNotNone(cache.load("3"))
+
+    def test_evicts_down_to_low_water(self):
+
+        cache = request.ResponseCache(self.tmpdir.name, 3600, 100000)
+        with patch.object(cache, "_entries", wraps=cache._entries) as mk_entries:
+            for code in range(200):
+                cache.store(str(code), make_response(content=b"x" * 1000))
+
+        self.assertLessEqual(cache._size, 100000)
+        # uma varredura inicial e poucas remocoes, nao uma a cada resposta
+        self.assertLess(mk_entries.call_count, 20)
 
 
 class TestConvert2SPSBody(unittest.TestCase):
@@ -146,6 +501,25 @@ class TestConvert2SPSBody(unittest.TestCase):
 
         self.assertEqual(node.attrib["rid"], "home")
 
+    def test_parser_a_anchor_ref_types(self):
+        obj = Convert2SPSBody(
+            '<p><a href="#fn1">1</a><a href="#t1">T</a><a href="#x">X</a></p>'
+            '<fn id="fn1"/><table id="t1"/>'
+        )
+        obj.process()
+
+        ref_types = [x.get("ref-type") for x in obj.obj_xml.iterfind(".//xref")]
+        self.assertEqual(ref_types, ["fn", "table", "author-notes"])
+
+    def test_get_element_by_id_builds_index_once(self):
+        obj = Convert2SPSBody('<p id="p1"/><p id="p2"/>')
+
+        node = obj.obj_xml.find("p")
+        self.assertIs(obj.get_element_by_id(node, "p2"), obj.obj_xml[1])
+        index = obj._ids
+        self.assertIsNone(obj.get_element_by_id(node, "p3"))
+        self.assertIs(obj._ids, index)
+
     def test_parser_a_hiperlink(self):
         node = self.etreeXML.find(".//font[@size='3']/a")
         self.convert.parser_a(node)
@@ -163,6 +537,17 @@ class TestConvert2SPSBody(unittest.TestCase):
                 has_message = True
         self.assertTrue(has_message)
 
+    def test_process_same_as_multi_pass(self):
+        expected = Convert2SPSBody(self.xml_txt)
+        for tag in expected.parser_tags:
+            for node in expected.obj_xml.findall(".//%s" % tag):
+                getattr(expected, "parser_%s" % tag)(node)
+
+        obj = Convert2SPSBody(self.xml_txt)
+        obj.process()
+
+        self.assertEqual(etree.tostring(obj.obj_xml), etree.tostring(expected.obj_xml))
+
     def test_process(self):
         obj = Convert2SPSBody(self.xml_txt)
         obj.process()
@@ -172,3 +557,203 @@ class TestConvert2SPSBody(unittest.TestCase):
             with self.subTest(tag=tag):
                 expected = obj.obj_xml.findall(".//%s" % tag)
                 self.assertFalse(expected)
+
+
+class TestUtilsParallel(unittest.TestCase):
+    def test_round_robin(self):
+
+        result = parallel.round_robin(iter(["abc", "d", "ef"]), 2)
+        self.assertEqual("".join(result), "adbcef")
+
+    def test_imap_unordered(self):
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = dict(
+                parallel.imap_unordered(executor, lambda x: x * 2, range(10), 3)
+            )
+
+        self.assertEqual(result, {x: x * 2 for x in range(10)})
+
+    def test_imap_unordered_bounds_pending(self):
+        def submit(func, item):
+            future = Future()
+            future.set_result(func(item))
+            return future
+
+        executor = MagicMock()
+        executor.submit.side_effect = submit
+
+        result = parallel.imap_unordered(executor, str, range(100), 5)
+        next(result)
+        self.assertEqual(executor.submit.call_count, 6)
+
+    def test_imap_unordered_raises(self):
+        def fail(x):
+            raise KeyError("Test Error - PARALLEL")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(KeyError):
+                list(parallel.imap_unordered(executor, fail, range(3), 2))
+
+
+class TestUtilsMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = metrics.Metrics()
+
+    def test_histogram(self):
+        for value in (0.001, 0.2, 100):
+            self.metrics.observe("stage_seconds", value)
+
+        histogram = self.metrics.snapshot()["histograms"]["stage_seconds"]
+        self.assertEqual(histogram["count"], 3)
+        self.assertEqual(histogram["min"], 0.001)
+        self.assertEqual(histogram["max"], 100)
+        self.assertEqual(histogram["buckets"][0], 1)
+        self.assertEqual(histogram["buckets"][-1], 1)
+
+    def test_merge(self):
+        other = metrics.Metrics()
+        other.inc("documents", 2)
+        other.observe("stage_seconds", 0.5)
+        self.metrics.inc("documents")
+        self.metrics.observe("stage_seconds", 1.5)
+
+        self.metrics.merge(other.snapshot())
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["counters"], {"documents": 3})
+        self.assertEqual(snapshot["histograms"]["stage_seconds"]["count"], 2)
+        self.assertEqual(snapshot["histograms"]["stage_seconds"]["sum"], 2.0)
+
+    def test_to_prometheus(self):
+        self.metrics.inc("documents", 2)
+        self.metrics.observe("stage_seconds", 0.5)
+
+        text = self.metrics.to_prometheus()
+        self.assertIn("documentstore_migracao_documents_total 2", text)
+        self.assertIn('documentstore_migracao_stage_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("documentstore_migracao_stage_seconds_count 1", text)
+
+    def test_dump_json(self):
+        self.metrics.inc("documents")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "metrics.json")
+            self.metrics.dump(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["counters"], {"documents": 1})
+
+    def test_measured_task(self):
+        task = metrics.MeasuredTask(len, "stage")
+        path = os.path.join(SAMPLES_PATH, "S0036-36341997000100001.xml")
+
+        result, snapshot = task(path)
+
+        self.assertEqual(result, len(path))
+        self.assertEqual(snapshot["counters"]["stage_documents"], 1)
+        self.assertEqual(snapshot["counters"]["stage_bytes"], os.path.getsize(path))
+        self.assertEqual(snapshot["histograms"]["stage_seconds"]["count"], 1)
+
+    def test_report_progress(self):
+        self.metrics.inc("documents")
+        with self.assertLogs("documentstore_migracao.utils.metrics") as log:
+            with metrics.report_progress(0.01, self.metrics):
+                time.sleep(0.05)
+
+        self.assertIn("documents=1", log.output[0])
+
+
+def log_worker_error(message):
+    logging.getLogger("documentstore_migracao.test").error(message)
+    return os.getpid()
+
+
+class TestUtilsLogger(unittest.TestCase):
+    def make_record(self, level=logging.INFO, lineno=10):
+        return logging.LogRecord(
+            "documentstore_migracao",
+            level,
+            __file__,
+            lineno,
+            "arquivo %s",
+            ("a",),
+            None,
+        )
+
+    def test_sampling_filter(self):
+        sampling = logger.SamplingFilter(3)
+
+        passed = [sampling.filter(self.make_record()) for _ in range(7)]
+
+        self.assertEqual(passed, [True, False, False, True, False, False, True])
+        self.assertEqual(sampling.suppressed(), {("documentstore_migracao", 10): 4})
+        self.assertTrue(sampling.filter(self.make_record(level=logging.WARNING)))
+
+    def test_sampling_filter_bypass(self):
+        sampling = logger.SamplingFilter(3)
+        record = self.make_record()
+        record.sample = False
+
+        self.assertEqual([sampling.filter(record) for _ in range(3)], [True] * 3)
+
+    def test_json_formatter(self):
+        try:
+            raise KeyError("Test Error")
+        except KeyError:
+            record = self.make_record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        data = json.loads(logger.JSONFormatter().format(record))
+        self.assertEqual(data["level"], "ERROR")
+        self.assertEqual(data["message"], "arquivo a")
+        self.assertIn("Test Error", data["exception"])
+
+    def restore_root_logger(self):
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        level = root.level
+
+        def restore():
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            for handler in handlers:
+                root.addHandler(handler)
+            root.setLevel(level)
+
+        self.addCleanup(restore)
+
+    def test_configure_bulk_logger_forked_workers(self):
+        self.restore_root_logger()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with utils.environ(LOGGER_PATH=tmpdir):
+                listener = logger.configure_bulk_logger(sample_rate=2)
+                with parallel.process_executor(2) as executor:
+                    pids = set(executor.map(log_worker_error, ["a", "b", "c"]))
+                listener.stop()
+
+            with open(os.path.join(tmpdir, "migracao.errors.jsonl")) as f:
+                rows = [json.loads(line) for line in f]
+
+        # os registros dos processos filhos sao gravados pelo processo pai
+        self.assertEqual(sorted(row["message"] for row in rows), ["a", "b", "c"])
+        self.assertEqual({row["process"] for row in rows}, pids)
+
+    def test_configure_bulk_logger(self):
+        self.restore_root_logger()
+        root = logging.getLogger()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with utils.environ(LOGGER_PATH=tmpdir):
+                listener = logger.configure_bulk_logger(sample_rate=2)
+                root.setLevel(logging.INFO)
+                log = logging.getLogger("documentstore_migracao.test")
+                for _ in range(3):
+                    log.info("arquivo lido")
+                log.error("arquivo com falha")
+                listener.stop()
+
+            with open(os.path.join(tmpdir, "migracao.errors.jsonl")) as f:
+                rows = [json.loads(line) for line in f]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["message"], "arquivo com falha")
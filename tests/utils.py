@@ -1,5 +1,8 @@
 import os
-from contextlib import contextmanager
+import tempfile
+from contextlib import contextmanager, ExitStack
+
+from documentstore_migracao import config
 
 
 @contextmanager
@@ -13,9 +16,32 @@ def environ(**kwargs):
             else:
                 todel.append(k)
             os.environ[k] = newval
+        config.reset()
         yield
     finally:
         for k, oldval in orig.items():
             os.environ[k] = oldval
         for k in todel:
             del os.environ[k]
+        config.reset()
+
+
+def enter_context(testcase, cm):
+    """ enters cm until the end of the test, as TestCase.enterContext """
+
+    with ExitStack() as stack:
+        result = stack.enter_context(cm)
+        testcase.addCleanup(stack.pop_all().close)
+    return result
+
+
+def tmpdir_environ(testcase, **kwargs):
+    """ temporary directory of the test, with the settings of kwargs set to
+    the paths inside it. Returns the path of the directory """
+
+    tmpdir = enter_context(testcase, tempfile.TemporaryDirectory())
+    enter_context(
+        testcase,
+        environ(**{key: os.path.join(tmpdir, name) for key, name in kwargs.items()}),
+    )
+    return tmpdir